@@ -6,6 +6,7 @@ Provides helper functions for finding, reading, and managing session files.
 
 import json
 import os
+from itertools import chain
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -28,13 +29,12 @@ def find_latest_session(sessions_dir: Path = DEFAULT_SESSION_DIR) -> Optional[Pa
     if not sessions_dir.exists():
         return None
         
-    session_files = sorted(
-        list(sessions_dir.glob("session_*.md")) +
-        list(sessions_dir.glob("*oneshot*.json")),
+    # Session names embed their timestamp, so the latest is the greatest name
+    return max(
+        chain(sessions_dir.glob("session_*.md"), sessions_dir.glob("*oneshot*.json")),
         key=lambda p: p.name,
-        reverse=True
+        default=None
     )
-    return session_files[0] if session_files else None
 
 
 def read_session_context(session_path: Path) -> Dict[str, Any]:
@@ -457,7 +457,11 @@ Configuration:
         )
 
         # Run the engine
-        success = engine.run()
+        try:
+            success = engine.run()
+        finally:
+            worker_executor.close()
+            auditor_executor.close()
 
     except Exception as e:
         log_debug(f"Engine execution failed: {e}")
@@ -26,6 +26,10 @@ from typing import Generator, Optional, Dict, Any, Iterator, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+# Parser for streamed JSON objects and NDJSON lines; parses exactly as
+# json.loads does and raises json.JSONDecodeError on invalid input
+from .utils.json_parsing import loads as _json_loads
+
 
 class InactivityTimeoutError(Exception):
     """Raised when a process shows no activity within the timeout window."""
@@ -96,8 +100,19 @@ def extract_json_objects(
             continue
 
         line_buffer += chunk
-        while "\n" in line_buffer:
-            line, line_buffer = line_buffer.split("\n", 1)
+        if "\n" not in line_buffer:
+            continue
+
+        if first_json_parsed and not in_json_block and "{" not in line_buffer:
+            # Only noise between objects can follow; keep the unterminated tail
+            line_buffer = line_buffer[line_buffer.rfind("\n") + 1:]
+            continue
+
+        # Split the buffer once per chunk rather than once per line; repeatedly
+        # slicing off the head of the buffer is quadratic for large chunks.
+        lines = line_buffer.split("\n")
+        line_buffer = lines.pop()
+        for line in lines:
             stripped = line.strip()
 
             if not in_json_block:
@@ -118,7 +133,7 @@ def extract_json_objects(
                     in_json_block = False
                     full_json = "".join(json_buffer)
                     try:
-                        obj = json.loads(full_json)
+                        obj = _json_loads(full_json)
                         first_json_parsed = True
                         yield obj
                     except json.JSONDecodeError:
@@ -141,7 +156,7 @@ def extract_json_objects(
             json_buffer.append(line_buffer)
             full_json = "".join(json_buffer)
             try:
-                obj = json.loads(full_json)
+                obj = _json_loads(full_json)
                 yield obj
             except json.JSONDecodeError:
                 yield full_json
@@ -282,7 +297,7 @@ def log_activity(
     is_markdown = filepath.endswith('.md')
 
     try:
-        with open(filepath, 'a') as f:
+        with open(filepath, 'a', encoding='utf-8') as f:
             for item in stream:
                 if is_markdown:
                     # Simple markdown formatting
@@ -396,13 +411,14 @@ def validate_ndjson(filepath: str) -> bool:
         True if all non-empty lines are valid JSON, False otherwise
     """
     try:
-        with open(filepath, 'r') as f:
+        # Lines are handed to the parser as bytes, skipping a decode pass
+        with open(filepath, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    json.loads(line)
+                    _json_loads(line)
                 except json.JSONDecodeError as e:
                     print(f"Invalid JSON at line {line_num}: {e}")
                     return False
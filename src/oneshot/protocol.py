@@ -7,10 +7,51 @@ This module provides:
 """
 
 import json
-from typing import List, Tuple, Optional, Dict, Any
+import mmap
+import os
+from collections import deque
+from typing import List, Tuple, Optional, Dict, Any, Union
 import re
 from dataclasses import dataclass, field
 
+# NDJSON line parser; accepts raw bytes and raises a ValueError subclass
+# on lines that are not JSON
+from .utils.json_parsing import loads as _json_loads
+
+_JSON_SPAN_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Event fields that carry executor output, in order of preference
+_RESULT_FIELDS = ('output', 'stdout', 'text', 'content', 'message', 'data')
+
+# State-machine bookkeeping events; these never carry a worker result
+_NON_RESULT_EVENT_TYPES = frozenset({'state_change'})
+
+
+# Logs up to this size are read in a single call; larger ones are memory-mapped
+_BULK_READ_LIMIT = 4 << 20
+
+# Marker appended to prompts cut at PromptGenerator.max_prompt_length
+_TRUNCATION_SUFFIX = "... [TRUNCATED]"
+
+
+def _iter_log_lines(log_path: str):
+    """Yield the raw lines of an NDJSON log as bytes."""
+    with open(log_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _BULK_READ_LIMIT:
+            yield from f.read().split(b'\n')
+            return
+
+        # Large logs are memory-mapped so only the current line is copied
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                yield mm[start:end]
+                start = end + 1
+
 
 @dataclass
 class ResultSummary:
@@ -56,67 +97,63 @@ class ResultExtractor:
         """
         Extract the best result from a log file with surrounding context.
 
+        Small logs are read in one call and larger ones memory-mapped. Only
+        the running best candidate and a small window of neighbouring events
+        are kept beyond the raw lines.
+
         Args:
             log_path: Path to oneshot-log.json (NDJSON format)
 
         Returns:
             A ResultSummary object, or None if no valid content found
         """
-        events = []
+        best_score = 0
+        best_text = None
+        leading_context: List[str] = []
+        trailing_context: List[str] = []
+        trailing_pending = 0  # Events still to inspect after the current best
+        recent = deque(maxlen=2)  # Texts of the two previous events
+
         try:
-            with open(log_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        events.append(event)
-                    except json.JSONDecodeError:
-                        continue
+            for line in _iter_log_lines(log_path):
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    event = _json_loads(line)
+                except ValueError:
+                    continue
+
+                text = self._format_event(event)
+
+                if trailing_pending:
+                    trailing_pending -= 1
+                    if text:
+                        trailing_context.append(text)
+
+                score = self._score_text(text) if text else 0
+                # Ties go to the latest candidate
+                if score > 0 and score >= best_score:
+                    best_score, best_text = score, text
+                    leading_context = [t for t in recent if t]
+                    trailing_context = []
+                    trailing_pending = 2
+                elif best_score == 0:
+                    # Fallback to last event if nothing scored high, even
+                    # when that event has no text
+                    best_text = text
+                    leading_context = [t for t in recent if t]
+
+                recent.append(text)
         except FileNotFoundError:
             return None
         except Exception:
             return None
 
-        if not events:
-            return None
-
-        # Format events and score them
-        scored_candidates = []
-        for i, event in enumerate(events):
-            text = self._format_event(event)
-            if text:
-                score = self._score_text(text)
-                if score > 0:
-                    scored_candidates.append((score, i, text))
-
-        if not scored_candidates:
-            # Fallback to last event if nothing scored high
-            best_idx = len(events) - 1
-            best_text = self._format_event(events[best_idx])
-            best_score = 0
-        else:
-            # Sort by score (descending), then by index (latest first for ties)
-            scored_candidates.sort(key=lambda x: (x[0], x[1]), reverse=True)
-            best_score, best_idx, best_text = scored_candidates[0]
-
         if not best_text:
             return None
 
-        # Extract context (up to 2 leading, 2 trailing)
-        leading_context = []
-        for i in range(max(0, best_idx - 2), best_idx):
-            ctx_text = self._format_event(events[i])
-            if ctx_text:
-                leading_context.append(ctx_text)
-
-        trailing_context = []
-        for i in range(best_idx + 1, min(len(events), best_idx + 3)):
-            ctx_text = self._format_event(events[i])
-            if ctx_text:
-                trailing_context.append(ctx_text)
-
         return ResultSummary(
             result=best_text,
             leading_context=leading_context,
@@ -137,10 +174,15 @@ class ResultExtractor:
         if not isinstance(event, dict):
             return str(event) if event else None
 
+        # Skip bookkeeping events before paying for the JSON fallback below
+        if event.get('type') in _NON_RESULT_EVENT_TYPES:
+            return None
+
         # Check for common output fields from executors
-        for field_name in ['output', 'stdout', 'text', 'content', 'message', 'data']:
-            if field_name in event and event[field_name]:
-                return str(event[field_name])
+        for field_name in _RESULT_FIELDS:
+            value = event.get(field_name)
+            if value:
+                return value if isinstance(value, str) else str(value)
 
         # If it's a structured response (like a tool call or status update), stringify it
         if event:
@@ -152,35 +194,44 @@ class ResultExtractor:
 
         return None
 
-    def _score_text(self, text: str) -> int:
+    def _score_text(self, text: Union[str, bytes]) -> int:
         """
         Score a text candidate based on fuzzy heuristics.
 
         Args:
-            text: The candidate text to score
+            text: The candidate text to score; raw UTF-8 bytes are accepted
 
         Returns:
             A score (higher is better).
         """
         if not text:
             return 0
+        if isinstance(text, bytes):
+            # Score on characters so the length bonus matches the str path
+            text = text.decode('utf-8', 'replace')
+
+        length = len(text)
+        if length < 4 and '{' not in text:
+            # Too short for any keyword; only a brace pair could still score
+            return 0
 
         score = 0
+        weights = self.score_weights
         text_upper = text.upper()
 
         # Keywords scoring
         if 'DONE' in text_upper:
-            score += self.score_weights['done_keyword']
+            score += weights['done_keyword']
         if 'STATUS' in text_upper:
-            score += self.score_weights['status_keyword']
+            score += weights['status_keyword']
         if 'SUCCESS' in text_upper:
-            score += self.score_weights['success_keyword']
-        
+            score += weights['success_keyword']
+
         # Requests for help/intervention (penalty)
         if 'HUMAN' in text_upper:
-            score += self.score_weights['human_keyword']
+            score += weights['human_keyword']
         if 'INTERVENTION' in text_upper:
-            score += self.score_weights['intervention_keyword']
+            score += weights['intervention_keyword']
 
         # Penalize API logging entries (they shouldn't be considered results)
         if '"request"' in text or '"tokensIn"' in text or '"tokensOut"' in text:
@@ -192,26 +243,26 @@ class ResultExtractor:
 
         # JSON patterns
         if '{' in text and '}' in text:
-            score += self.score_weights['json_structure']
+            score += weights['json_structure']
             try:
                 # Check for actual valid JSON
                 # Some agents output JSON inside markdown, we try to find it
-                json_match = re.search(r'\{.*\}', text, re.DOTALL)
+                json_match = _JSON_SPAN_RE.search(text)
                 if json_match:
                     json.loads(json_match.group())
-                    score += self.score_weights['json_valid']
+                    score += weights['json_valid']
             except:
                 pass
 
         # Field-specific scoring (if text is JSON string)
         if '"status"' in text or "'status'" in text:
-            score += self.score_weights['status_field']
+            score += weights['status_field']
         if '"result"' in text or "'result'" in text:
-            score += self.score_weights['result_field']
+            score += weights['result_field']
 
         # Length bonus
-        if len(text) > 100:
-            score += self.score_weights['substantial_length']
+        if length > 100:
+            score += weights['substantial_length']
 
         return score
 
@@ -226,6 +277,10 @@ class PromptGenerator:
     to provide continuity and context for multi-iteration loops.
     """
 
+    # Prompt header lines, formatted with (oneshot_id, iteration)
+    _WORKER_HEADER = "<oneshot>{} worker #{}</oneshot>\n"
+    _AUDIT_HEADER = "<oneshot>{} audit #{}</oneshot>\n"
+
     def __init__(self, context=None, max_prompt_length: int = 100000):
         """
         Initialize the prompt generator.
@@ -249,29 +304,31 @@ class PromptGenerator:
         """
         Generate a worker prompt using XML layout.
         """
-        parts = []
-        parts.append(f"<oneshot>{oneshot_id} worker #{iteration}</oneshot>\n")
+        header = self._WORKER_HEADER.format(oneshot_id, iteration)
 
         if auditor_feedback:
-            parts.append("<auditor-feedback>")
-            parts.append(auditor_feedback)
-            parts.append("</auditor-feedback>\n")
-            
-            parts.append("<instruction>")
-            parts.append(instruction)
-            parts.append("</instruction>\n")
-            
+            parts = [
+                header,
+                "<auditor-feedback>",
+                auditor_feedback,
+                "</auditor-feedback>\n",
+                "<instruction>",
+                instruction,
+                "</instruction>\n",
+            ]
             if reworker_system_prompt:
                 parts.append(reworker_system_prompt)
         else:
-            parts.append(system_prompt)
-            parts.append("\n")
-            parts.append("<instruction>")
-            parts.append(instruction)
-            parts.append("</instruction>")
+            parts = [
+                header,
+                system_prompt,
+                "\n",
+                "<instruction>",
+                instruction,
+                "</instruction>",
+            ]
 
-        prompt = "\n".join(parts)
-        return self._truncate_to_limit(prompt)
+        return self._join_to_limit(parts)
 
     def generate_auditor_prompt(
         self,
@@ -284,35 +341,47 @@ class PromptGenerator:
         """
         Generate an auditor prompt using XML layout.
         """
-        parts = []
-        parts.append(f"<oneshot>{oneshot_id} audit #{iteration}</oneshot>\n")
+        parts = [
+            self._AUDIT_HEADER.format(oneshot_id, iteration),
+            "<what-was-requested>",
+            original_prompt,
+            "</what-was-requested>\n",
+            "<worker-result>",
+        ]
 
-        parts.append("<what-was-requested>")
-        parts.append(original_prompt)
-        parts.append("</what-was-requested>\n")
-
-        parts.append("<worker-result>")
-        
         if result_summary.leading_context:
-            parts.append(" <leading-context>")
-            parts.append("\n".join(result_summary.leading_context))
-            parts.append(" </leading-context>")
-        
+            parts.extend((
+                " <leading-context>",
+                "\n".join(result_summary.leading_context),
+                " </leading-context>",
+            ))
+
         parts.append(result_summary.result)
-        
+
         if result_summary.trailing_context:
-            parts.append(" <trailing-context>")
-            parts.append("\n".join(result_summary.trailing_context))
-            parts.append(" </trailing-context>")
-            
+            parts.extend((
+                " <trailing-context>",
+                "\n".join(result_summary.trailing_context),
+                " </trailing-context>",
+            ))
+
         parts.append("</worker-result>\n")
         parts.append(auditor_system_prompt)
 
-        prompt = "\n".join(parts)
-        return self._truncate_to_limit(prompt)
+        return self._join_to_limit(parts)
 
-    def _truncate_to_limit(self, prompt: str) -> str:
-        """Truncate prompt if it exceeds max_prompt_length (simple character truncation)."""
-        if len(prompt) > self.max_prompt_length:
-            return prompt[:self.max_prompt_length] + "... [TRUNCATED]"
-        return prompt
\ No newline at end of file
+    def _join_to_limit(self, parts: List[str]) -> str:
+        """
+        Join prompt parts with newlines, truncating past max_prompt_length.
+
+        The result equals joining everything and cutting at the limit, but
+        the parts after the limit (often a huge instruction) are never copied.
+        """
+        limit = self.max_prompt_length
+        size = -1  # no separator before the first part
+        for index, part in enumerate(parts):
+            size += len(part) + 1
+            if size > limit:
+                head = "\n".join(parts[:index] + [""]) if index else ""
+                return head[:limit] + part[:max(0, limit - len(head))] + _TRUNCATION_SUFFIX
+        return "\n".join(parts)
\ No newline at end of file
@@ -15,6 +15,9 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Parses the JSON value at an offset and returns it with the end index
+_decode_json_prefix = json.JSONDecoder().raw_decode
+
 
 class ActivityType(Enum):
     """Types of meaningful Claude activity to track."""
@@ -277,67 +280,18 @@ class ActivityInterpreter:
             List of parsed JSON objects
         """
         json_objects = []
-        i = 0
-
-        while i < len(text):
-            # Skip whitespace
-            while i < len(text) and text[i].isspace():
-                i += 1
-
-            if i >= len(text):
-                break
-
-            # Look for opening brace
-            if text[i] != '{':
-                i += 1
-                continue
-
-            # Try to parse a complete JSON object starting from this position
-            brace_count = 0
-            start_pos = i
-            in_string = False
-            escape_next = False
+        start = text.find('{')
 
+        while start != -1:
+            # Decode one object in place; concatenated objects need no separator
             try:
-                for j in range(i, len(text)):
-                    char = text[j]
-
-                    if escape_next:
-                        escape_next = False
-                        continue
-
-                    if char == '\\':
-                        escape_next = True
-                        continue
-
-                    if char == '"' and not escape_next:
-                        in_string = not in_string
-                        continue
-
-                    if not in_string:
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                # Found complete JSON object
-                                json_str = text[start_pos:j + 1]
-                                try:
-                                    obj = json.loads(json_str)
-                                    json_objects.append(obj)
-                                    i = j + 1
-                                    break
-                                except json.JSONDecodeError:
-                                    # Not valid JSON, continue searching
-                                    i = start_pos + 1
-                                    break
-                    if j == len(text) - 1:
-                        # Reached end without closing brace
-                        i = start_pos + 1
-                        break
-
-            except IndexError:
-                break
+                obj, end = _decode_json_prefix(text, start)
+            except json.JSONDecodeError:
+                # Not valid JSON here; retry from the next opening brace
+                start = text.find('{', start + 1)
+                continue
+            json_objects.append(obj)
+            start = text.find('{', end)
 
         return json_objects
 
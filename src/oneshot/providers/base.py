@@ -1,3 +1,4 @@
+import re
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -5,6 +6,57 @@ from typing import Optional, Dict, Any, List, Tuple, Generator
 
 from ..constants import WORKER_SYSTEM_PROMPT, AUDITOR_SYSTEM_PROMPT, REWORKER_SYSTEM_PROMPT
 
+# OSC strings (hyperlinks, titles), CSI sequences and two-byte escapes
+# emitted by terminal UIs
+_ANSI_ESCAPE = re.compile(
+    r'\x1B(?:\][^\x07\x1B]*(?:\x07|\x1B\\)|[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])'
+)
+
+# Role -> system instructions, resolved once at import time
+_SYSTEM_INSTRUCTIONS = {
+    "worker": WORKER_SYSTEM_PROMPT,
+    "auditor": AUDITOR_SYSTEM_PROMPT,
+    "reworker": REWORKER_SYSTEM_PROMPT,
+}
+
+# Completion guidance placed under the header of every XML worker prompt
+_WORKER_COMPLETION_GUIDANCE = """IMPORTANT: Provide your final answer in valid JSON format when possible. Include completion indicators like "DONE", "success", or "status" even in non-JSON responses.
+
+PREFERRED FORMAT (valid JSON):
+{
+  "status": "DONE",
+  "result": "<your answer/output here>",
+  "confidence": "<high/medium/low>",
+  "validation": "<how you verified this answer - sources, output shown, reasoning explained>",
+  "execution_proof": "<what you actually did - optional if no external tools were used>"
+}
+
+ALTERNATIVE: If JSON is difficult, include clear completion indicators:
+- Words like "DONE", "success", "completed", "finished"
+- Status/result fields even in malformed JSON
+- Clear indication that the task is complete
+
+IMPORTANT GUIDANCE:
+- "result" should be your final answer
+- "validation" should describe HOW you got it (tools used, sources checked, actual output if execution)
+- "execution_proof" is optional - only include if you used external tools, commands, or computations
+- For knowledge-based answers: brief validation is sufficient
+- For coding tasks: describe the changes made
+- Be honest and specific - don't make up results
+- Set "status" to "DONE" or use completion words when you believe the task is completed"""
+
+
+# Fixed tail of every XML auditor prompt
+_AUDITOR_VERDICT_INSTRUCTIONS = "\n".join([
+    "Your verdict must be one of:",
+    '- "DONE": The task has been completed successfully.',
+    '- "RETRY": The task is incomplete. Ask the worker to try again.',
+    '- "IMPOSSIBLE": The task cannot be completed (missing resources, permissions denied, etc.).',
+    "",
+    "Respond with ONLY your verdict and a brief explanation.",
+])
+
+
 @dataclass
 class RecoveryResult:
     """
@@ -167,6 +219,15 @@ class BaseExecutor(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """
+        Release resources held between tasks, such as pooled HTTP sessions.
+
+        Executors that hold nothing beyond a single execute() call need not
+        override this.
+        """
+        pass
+
     def _sanitize_environment(self, env: Dict[str, str]) -> Dict[str, str]:
         """
         Sanitize environment variables to remove sensitive information.
@@ -201,9 +262,7 @@ class BaseExecutor(ABC):
         Returns:
             str: Text with color codes stripped
         """
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE.sub('', text)
 
     def get_system_instructions(self, role: str) -> str:
         """
@@ -217,14 +276,10 @@ class BaseExecutor(ABC):
         Returns:
             str: System instructions for the specified role
         """
-        if role == "worker":
-            return WORKER_SYSTEM_PROMPT
-        elif role == "auditor":
-            return AUDITOR_SYSTEM_PROMPT
-        elif role == "reworker":
-            return REWORKER_SYSTEM_PROMPT
-        else:
-            raise ValueError(f"Unknown role: {role}")
+        try:
+            return _SYSTEM_INSTRUCTIONS[role]
+        except KeyError:
+            raise ValueError(f"Unknown role: {role}") from None
 
     def format_prompt(self, task: str, role: str, header: Optional[str] = None, context: Optional[Dict] = None) -> str:
         """
@@ -255,35 +310,7 @@ class BaseExecutor(ABC):
         """Format worker/reworker prompt with XML structure."""
         header = header or "oneshot execution"
 
-        # Build header with completion guidance
-        header_template = f"""{header}
-
-IMPORTANT: Provide your final answer in valid JSON format when possible. Include completion indicators like "DONE", "success", or "status" even in non-JSON responses.
-
-PREFERRED FORMAT (valid JSON):
-{{
-  "status": "DONE",
-  "result": "<your answer/output here>",
-  "confidence": "<high/medium/low>",
-  "validation": "<how you verified this answer - sources, output shown, reasoning explained>",
-  "execution_proof": "<what you actually did - optional if no external tools were used>"
-}}
-
-ALTERNATIVE: If JSON is difficult, include clear completion indicators:
-- Words like "DONE", "success", "completed", "finished"
-- Status/result fields even in malformed JSON
-- Clear indication that the task is complete
-
-IMPORTANT GUIDANCE:
-- "result" should be your final answer
-- "validation" should describe HOW you got it (tools used, sources checked, actual output if execution)
-- "execution_proof" is optional - only include if you used external tools, commands, or computations
-- For knowledge-based answers: brief validation is sufficient
-- For coding tasks: describe the changes made
-- Be honest and specific - don't make up results
-- Set "status" to "DONE" or use completion words when you believe the task is completed
-
-"""
+        parts = [header, "", _WORKER_COMPLETION_GUIDANCE, ""]
 
         # Add iteration context if applicable
         iteration = context.get('iteration', 0)
@@ -291,14 +318,20 @@ IMPORTANT GUIDANCE:
         auditor_feedback = context.get('auditor_feedback')
 
         if iteration > 0 and auditor_feedback:
-            iteration_context = f"""\n\n[Iteration {iteration + 1}/{max_iterations}]\nPrevious attempts did not complete the task. Try again with a different approach.
-
-AUDITOR FEEDBACK:
-{auditor_feedback}
-"""
-            return header_template + iteration_context + f"\nComplete this task:\n{task}"
-        else:
-            return header_template + f"Complete this task:\n{task}"
+            parts.extend([
+                "",
+                "",
+                f"[Iteration {iteration + 1}/{max_iterations}]",
+                "Previous attempts did not complete the task. Try again with a different approach.",
+                "",
+                "AUDITOR FEEDBACK:",
+                str(auditor_feedback),
+                "",
+            ])
+
+        parts.append("Complete this task:")
+        parts.append(str(task))
+        return "\n".join(parts)
 
     def _format_auditor_prompt(self, task: str, header: str, context: Dict, system_instructions: str) -> str:
         """Format auditor prompt with XML structure."""
@@ -306,21 +339,16 @@ AUDITOR FEEDBACK:
 
         worker_result = context.get('worker_result', '(No worker output found)')
 
-        prompt = f"""{header}
-
-{system_instructions}
-
-TASK:
-{task}
-
-WORK RESULT:
-{worker_result}
-
-Your verdict must be one of:
-- "DONE": The task has been completed successfully.
-- "RETRY": The task is incomplete. Ask the worker to try again.
-- "IMPOSSIBLE": The task cannot be completed (missing resources, permissions denied, etc.).
-
-Respond with ONLY your verdict and a brief explanation."""
-
-        return prompt
\ No newline at end of file
+        return "\n".join([
+            header,
+            "",
+            system_instructions,
+            "",
+            "TASK:",
+            str(task),
+            "",
+            "WORK RESULT:",
+            str(worker_result),
+            "",
+            _AUDITOR_VERDICT_INSTRUCTIONS,
+        ])
@@ -13,6 +13,9 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple, Generator
 from .base import BaseExecutor, ExecutionResult, RecoveryResult
 
+# SGR colour codes, including 256-colour codes whose ESC was already dropped
+_ANSI_COLOR = re.compile(r'\x1B\[[0-9;]*m|\[38;5;\d+m')
+
 
 class ClaudeExecutor(BaseExecutor):
     """
@@ -311,8 +314,7 @@ class ClaudeExecutor(BaseExecutor):
             return json_objects
 
         # Remove ANSI escape codes that Claude includes
-        ansi_escape = re.compile(r'\x1B\[[0-9;]*m|\[38;5;\d+m')
-        cleaned = ansi_escape.sub('', raw_output)
+        cleaned = _ANSI_COLOR.sub('', raw_output)
 
         # Find each complete JSON object by tracking braces
         brace_count = 0
@@ -14,6 +14,44 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple, Generator
 from .base import BaseExecutor, ExecutionResult, RecoveryResult
 
+# SGR colour codes, including 256-colour codes whose ESC was already dropped
+_ANSI_COLOR = re.compile(r'\x1B\[[0-9;]*m|\[38;5;\d+m')
+
+# Markdown system instructions per role, built once at import time
+_CLINE_SYSTEM_INSTRUCTIONS = {
+    "worker": """You are an autonomous intelligent agent. Complete the task described below.
+
+Focus on fulfilling the requirements described in the task. Be direct and practical in your approach.""",
+    "auditor": """You are a Success Auditor. Evaluate the worker's response with trust by default, accepting both structured and plain text responses with clear completion indicators.
+
+The original task and project context should guide your evaluation of what "DONE" means. Be lenient and trust the worker's judgment unless there are clear, serious issues.
+
+Accept responses that show clear completion intent:
+- Clear completion indicators like "DONE", "success", "completed", "finished"
+- Any response that reasonably addresses the task
+
+Only reject if there are REAL, significant issues:
+1. Does the response show clear completion intent? (reject only if completely unclear)
+2. Does the result seem reasonable for the task? (reject only if completely implausible)
+3. Is there any indication of task completion? (reject only if entirely missing)""",
+    "reworker": """You are an autonomous intelligent agent. The previous attempt to complete the task was marked as incomplete. Review the feedback below and re-attempt the task, ensuring you address the concerns raised.
+
+Focus on fulfilling the requirements described in the task. Be direct and practical in your approach.""",
+}
+
+
+# Fixed "## Evaluation" section closing every Cline auditor prompt
+_CLINE_AUDITOR_EVALUATION = "\n".join([
+    "## Evaluation",
+    "",
+    "Respond with ONLY your verdict and a brief explanation.",
+    "",
+    "Your verdict must be one of:",
+    "- DONE: The task has been completed successfully.",
+    "- RETRY: The task is incomplete. Ask the worker to try again.",
+    "- IMPOSSIBLE: The task cannot be completed.",
+])
+
 
 class ClineExecutor(BaseExecutor):
     """
@@ -294,8 +332,7 @@ class ClineExecutor(BaseExecutor):
             return json_objects
 
         # Remove ANSI escape codes that Cline includes
-        ansi_escape = re.compile(r'\x1B\[[0-9;]*m|\[38;5;\d+m')
-        cleaned = ansi_escape.sub('', raw_output)
+        cleaned = _ANSI_COLOR.sub('', raw_output)
 
         # Find each complete JSON object by tracking braces
         brace_count = 0
@@ -395,29 +432,10 @@ class ClineExecutor(BaseExecutor):
         Returns:
             str: Markdown-formatted system instructions for the specified role
         """
-        if role == "worker":
-            return """You are an autonomous intelligent agent. Complete the task described below.
-
-Focus on fulfilling the requirements described in the task. Be direct and practical in your approach."""
-        elif role == "auditor":
-            return """You are a Success Auditor. Evaluate the worker's response with trust by default, accepting both structured and plain text responses with clear completion indicators.
-
-The original task and project context should guide your evaluation of what "DONE" means. Be lenient and trust the worker's judgment unless there are clear, serious issues.
-
-Accept responses that show clear completion intent:
-- Clear completion indicators like "DONE", "success", "completed", "finished"
-- Any response that reasonably addresses the task
-
-Only reject if there are REAL, significant issues:
-1. Does the response show clear completion intent? (reject only if completely unclear)
-2. Does the result seem reasonable for the task? (reject only if completely implausible)
-3. Is there any indication of task completion? (reject only if entirely missing)"""
-        elif role == "reworker":
-            return """You are an autonomous intelligent agent. The previous attempt to complete the task was marked as incomplete. Review the feedback below and re-attempt the task, ensuring you address the concerns raised.
-
-Focus on fulfilling the requirements described in the task. Be direct and practical in your approach."""
-        else:
-            raise ValueError(f"Unknown role: {role}")
+        try:
+            return _CLINE_SYSTEM_INSTRUCTIONS[role]
+        except KeyError:
+            raise ValueError(f"Unknown role: {role}") from None
 
     def format_prompt(self, task: str, role: str, header: Optional[str] = None, context: Optional[Dict] = None) -> str:
         """
@@ -512,14 +530,7 @@ Focus on fulfilling the requirements described in the task. Be direct and practi
             "",
             worker_result,
             "",
-            "## Evaluation",
-            "",
-            "Respond with ONLY your verdict and a brief explanation.",
-            "",
-            "Your verdict must be one of:",
-            "- DONE: The task has been completed successfully.",
-            "- RETRY: The task is incomplete. Ask the worker to try again.",
-            "- IMPOSSIBLE: The task cannot be completed."
+            _CLINE_AUDITOR_EVALUATION,
         ]
 
         return "\n".join(prompt_parts)
\ No newline at end of file
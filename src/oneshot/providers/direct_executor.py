@@ -314,6 +314,10 @@ class DirectExecutor(BaseExecutor):
                 }
             )
 
+    def close(self) -> None:
+        """Close the Ollama client's pooled HTTP session."""
+        self.client.close()
+
     def __repr__(self) -> str:
         """
         Provide a string representation of the DirectExecutor.
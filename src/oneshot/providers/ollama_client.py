@@ -140,6 +140,10 @@ class OllamaClient:
         except:
             return False
 
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+
     def __repr__(self) -> str:
         """String representation of Ollama client."""
         return f"OllamaClient(base_url={self.base_url}, timeout={self.timeout})"
\ No newline at end of file
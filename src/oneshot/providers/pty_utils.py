@@ -27,6 +27,10 @@ from typing import Optional, Tuple, List
 DISABLE_STREAMING = os.environ.get('ONESHOT_DISABLE_STREAMING', '0') == '1'
 SUPPORTS_PTY = platform.system() in ('Linux', 'Darwin')  # Unix/Linux and macOS
 
+# Default PTY read size and flush threshold for accumulated output, in bytes
+DEFAULT_BUFFER_SIZE = 1024
+DEFAULT_ACCUMULATION_BUFFER_SIZE = 4096
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
@@ -63,8 +67,8 @@ def _log_verbose(msg: str):
 
 def call_executor_pty(cmd: List[str], input_data: Optional[str] = None,
                       timeout: Optional[float] = None,
-                      buffer_size: int = 1024,
-                      accumulation_buffer_size: int = 4096) -> Tuple[str, str, int]:
+                      buffer_size: int = DEFAULT_BUFFER_SIZE,
+                      accumulation_buffer_size: int = DEFAULT_ACCUMULATION_BUFFER_SIZE) -> Tuple[str, str, int]:
     """
     Execute command using PTY allocation for real-time streaming output.
 
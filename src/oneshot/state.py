@@ -7,7 +7,8 @@ This module encapsulates the authoritative state machine and action selection lo
 
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Dict, Set, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Set, Any, Optional, Tuple, Mapping
 
 
 class OnehotState(Enum):
@@ -39,22 +40,90 @@ class ActionType(Enum):
     WAIT = auto()
 
 
-@dataclass
+# Shared read-only payload for actions that carry no context
+_NO_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
 class Action:
     """
     Represents an action that the Engine should execute.
 
+    Actions are immutable so that StateMachine can hand out shared instances.
+
     Attributes:
         type: The type of action to perform.
         payload: Additional context data for the action.
     """
     type: ActionType
-    payload: Dict[str, Any] = field(default_factory=dict)
+    payload: Mapping[str, Any] = field(default_factory=lambda: _NO_PAYLOAD)
+
+
+def _exit_action(reason: str) -> Action:
+    """Build a shareable EXIT action with a read-only payload."""
+    return Action(ActionType.EXIT, payload=MappingProxyType({"reason": reason}))
+
+
+# Next action for each state; actions depend on the state alone, so one
+# instance per state is built at import time and shared by every caller
+_ACTION_BY_STATE: Dict[OnehotState, Action] = {
+    OnehotState.CREATED: Action(ActionType.RUN_WORKER),
+    OnehotState.WORKER_EXECUTING: Action(ActionType.WAIT),
+    OnehotState.AUDIT_PENDING: Action(ActionType.RUN_AUDITOR),
+    OnehotState.AUDITOR_EXECUTING: Action(ActionType.WAIT),
+    OnehotState.REITERATION_PENDING: Action(ActionType.RUN_WORKER),
+    OnehotState.RECOVERY_PENDING: Action(ActionType.RECOVER),
+    OnehotState.COMPLETED: _exit_action("success"),
+    OnehotState.REJECTED: _exit_action("success"),
+    OnehotState.FAILED: _exit_action("failed"),
+    OnehotState.INTERRUPTED: _exit_action("interrupted"),
+}
 
 
 class InvalidTransitionError(Exception):
-    """Raised when an invalid state transition is attempted."""
-    pass
+    """
+    Raised when an invalid state transition is attempted.
+
+    The message is only formatted when the error is displayed, since callers
+    that probe for valid transitions usually discard it.
+
+    Attributes:
+        state: The state the transition was attempted from.
+        event_type: The event that has no transition from that state.
+    """
+
+    def __init__(self, state: OnehotState, event_type: str):
+        super().__init__(state, event_type)
+        self.state = state
+        self.event_type = event_type
+
+    def __str__(self) -> str:
+        return f"Invalid transition: ({self.state.name}, {self.event_type})"
+
+
+def _build_transition_table(
+    event_transitions: Dict[Tuple[OnehotState, str], OnehotState],
+    interruptible: Set[OnehotState],
+    allowed: Dict[OnehotState, Set[OnehotState]],
+) -> Dict[OnehotState, Dict[str, OnehotState]]:
+    """
+    Flatten (state, event) -> state rules into state -> {event: state}.
+
+    The shared "interrupt" rule is expanded for every interruptible state.
+
+    Rules whose target is not an allowed next state are left out, so they
+    fail like any other unknown event. Terminal states map to empty dicts.
+    """
+    table: Dict[OnehotState, Dict[str, OnehotState]] = {
+        state: {} for state in OnehotState
+    }
+    rules = dict(event_transitions)
+    for current in interruptible:
+        rules[(current, "interrupt")] = OnehotState.INTERRUPTED
+    for (current, event_type), next_state in rules.items():
+        if next_state in allowed.get(current, ()):
+            table[current][event_type] = next_state
+    return table
 
 
 class StateMachine:
@@ -121,37 +190,46 @@ class StateMachine:
         OnehotState.INTERRUPTED: set(),
     }
 
-    # Map event types to transition outcomes
+    # Every non-terminal state moves to INTERRUPTED on "interrupt"
+    _INTERRUPTIBLE_STATES = frozenset({
+        OnehotState.CREATED,
+        OnehotState.WORKER_EXECUTING,
+        OnehotState.AUDIT_PENDING,
+        OnehotState.AUDITOR_EXECUTING,
+        OnehotState.REITERATION_PENDING,
+        OnehotState.RECOVERY_PENDING,
+    })
+
+    # Map event types to transition outcomes, besides "interrupt" above
     # Format: (current_state, event_type) -> next_state
     _EVENT_TRANSITIONS = {
         (OnehotState.CREATED, "start"): OnehotState.WORKER_EXECUTING,
-        (OnehotState.CREATED, "interrupt"): OnehotState.INTERRUPTED,
 
         (OnehotState.WORKER_EXECUTING, "success"): OnehotState.AUDIT_PENDING,
         (OnehotState.WORKER_EXECUTING, "crash"): OnehotState.RECOVERY_PENDING,
         (OnehotState.WORKER_EXECUTING, "inactivity"): OnehotState.RECOVERY_PENDING,
-        (OnehotState.WORKER_EXECUTING, "interrupt"): OnehotState.INTERRUPTED,
 
         (OnehotState.AUDIT_PENDING, "next"): OnehotState.AUDITOR_EXECUTING,
-        (OnehotState.AUDIT_PENDING, "interrupt"): OnehotState.INTERRUPTED,
 
         (OnehotState.AUDITOR_EXECUTING, "done"): OnehotState.COMPLETED,
         (OnehotState.AUDITOR_EXECUTING, "retry"): OnehotState.REITERATION_PENDING,
         (OnehotState.AUDITOR_EXECUTING, "impossible"): OnehotState.REJECTED,
         (OnehotState.AUDITOR_EXECUTING, "crash"): OnehotState.FAILED,
         (OnehotState.AUDITOR_EXECUTING, "inactivity"): OnehotState.FAILED,
-        (OnehotState.AUDITOR_EXECUTING, "interrupt"): OnehotState.INTERRUPTED,
 
         (OnehotState.REITERATION_PENDING, "next"): OnehotState.WORKER_EXECUTING,
         (OnehotState.REITERATION_PENDING, "max_iterations"): OnehotState.FAILED,
-        (OnehotState.REITERATION_PENDING, "interrupt"): OnehotState.INTERRUPTED,
 
         (OnehotState.RECOVERY_PENDING, "zombie_success"): OnehotState.AUDIT_PENDING,
         (OnehotState.RECOVERY_PENDING, "zombie_partial"): OnehotState.REITERATION_PENDING,
         (OnehotState.RECOVERY_PENDING, "zombie_dead"): OnehotState.FAILED,
-        (OnehotState.RECOVERY_PENDING, "interrupt"): OnehotState.INTERRUPTED,
     }
 
+    # The rules above resolved once into current_state -> {event: next_state}
+    _TABLE = _build_transition_table(
+        _EVENT_TRANSITIONS, _INTERRUPTIBLE_STATES, TRANSITIONS
+    )
+
     def __init__(self):
         """Initialize the state machine."""
         self.current_state = OnehotState.CREATED
@@ -178,22 +256,10 @@ class StateMachine:
             >>> sm.transition(OnehotState.WORKER_EXECUTING, "success")
             <OnehotState.AUDIT_PENDING: 9>
         """
-        key = (current, event_type)
-
-        if key not in self._EVENT_TRANSITIONS:
-            raise InvalidTransitionError(
-                f"Invalid transition: ({current.name}, {event_type})"
-            )
-
-        next_state = self._EVENT_TRANSITIONS[key]
-
-        # Validate against transition table
-        if next_state not in self.TRANSITIONS.get(current, set()):
-            raise InvalidTransitionError(
-                f"Transition from {current.name} to {next_state.name} is not allowed"
-            )
-
-        return next_state
+        try:
+            return self._TABLE[current][event_type]
+        except KeyError:
+            raise InvalidTransitionError(current, event_type) from None
 
     def get_next_action(self, state: OnehotState) -> Action:
         """
@@ -215,30 +281,7 @@ class StateMachine:
             >>> action.type
             <ActionType.RUN_AUDITOR: 2>
         """
-        if state == OnehotState.CREATED:
-            return Action(ActionType.RUN_WORKER)
-
-        elif state == OnehotState.WORKER_EXECUTING:
-            return Action(ActionType.WAIT)
-
-        elif state == OnehotState.AUDIT_PENDING:
-            return Action(ActionType.RUN_AUDITOR)
-
-        elif state == OnehotState.AUDITOR_EXECUTING:
-            return Action(ActionType.WAIT)
-
-        elif state == OnehotState.REITERATION_PENDING:
-            return Action(ActionType.RUN_WORKER)
-
-        elif state == OnehotState.RECOVERY_PENDING:
-            return Action(ActionType.RECOVER)
-
-        elif state in (OnehotState.COMPLETED, OnehotState.REJECTED):
-            return Action(ActionType.EXIT, payload={"reason": "success"})
-
-        elif state in (OnehotState.FAILED, OnehotState.INTERRUPTED):
-            return Action(ActionType.EXIT, payload={"reason": state.name.lower()})
-
-        else:
-            # Fallback for unknown state
-            raise ValueError(f"Unknown state: {state}")
+        try:
+            return _ACTION_BY_STATE[state]
+        except KeyError:
+            raise ValueError(f"Unknown state: {state}") from None
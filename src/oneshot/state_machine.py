@@ -6,8 +6,9 @@ process interruption and idle detection.
 """
 
 import asyncio
+import time
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Callable
 from statemachine import StateMachine, State
 
 from .events import EventType, emit_task_event
@@ -23,6 +24,13 @@ class TaskState(Enum):
     FAILED = "failed"
 
 
+# States from which a task can still be interrupted
+_INTERRUPTIBLE_STATES = frozenset({TaskState.RUNNING, TaskState.IDLE})
+
+# States in which a task has stopped for good
+_FINISHED_STATES = frozenset({TaskState.COMPLETED, TaskState.FAILED, TaskState.INTERRUPTED})
+
+
 class OneshotStateMachine(StateMachine):
     """
     State machine for managing Oneshot task execution lifecycle.
@@ -60,32 +68,37 @@ class OneshotStateMachine(StateMachine):
     finish = running.to(completed) | idle.to(completed) | completed.to(completed, internal=True)
     fail = created.to(failed) | running.to(failed) | idle.to(failed) | interrupted.to(failed) | failed.to(failed, internal=True) | completed.to(failed)
 
-    def __init__(self, task_id: str, process: Optional[Any] = None):
+    def __init__(
+        self,
+        task_id: str,
+        process: Optional[Any] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ):
         """
         Initialize the state machine.
 
         Args:
             task_id: Unique identifier for the task
             process: Optional subprocess handle for process management
+            clock: Optional time source for activity stamps; defaults to the
+                running event loop's clock
         """
         super().__init__()
         self.task_id = task_id
         self.process = process
-        try:
-            self.last_activity = asyncio.get_running_loop().time()
-        except RuntimeError:
-            # No running event loop, use time module
-            import time
-            self.last_activity = time.time()
+        self.clock = clock
+        self.update_activity()
 
     def update_activity(self):
-        """Update the last activity timestamp."""
+        """Update the last activity timestamp on the event loop's clock."""
+        if self.clock is not None:
+            self.last_activity = self.clock()
+            return
         try:
             self.last_activity = asyncio.get_running_loop().time()
         except RuntimeError:
-            # No running loop, use time module
-            import time
-            self.last_activity = time.time()
+            # No running loop; asyncio's default loop clock is time.monotonic()
+            self.last_activity = time.monotonic()
 
     async def emit_event(self, event_type: EventType, **kwargs):
         """
@@ -112,7 +125,6 @@ class OneshotStateMachine(StateMachine):
                     loop = asyncio.get_running_loop()
                     loop.run_until_complete(asyncio.sleep(0.1))
                 except RuntimeError:
-                    import time
                     time.sleep(0.1)
 
                 # Force kill if still running
@@ -149,8 +161,8 @@ class OneshotStateMachine(StateMachine):
 
     def can_interrupt(self) -> bool:
         """Check if the task can be interrupted (is running or idle)."""
-        return self.current_state_enum in [TaskState.RUNNING, TaskState.IDLE]
+        return self.current_state_enum in _INTERRUPTIBLE_STATES
 
     def is_finished(self) -> bool:
         """Check if the task has finished (completed, failed, or interrupted)."""
-        return self.current_state_enum in [TaskState.COMPLETED, TaskState.FAILED, TaskState.INTERRUPTED]
\ No newline at end of file
+        return self.current_state_enum in _FINISHED_STATES
\ No newline at end of file
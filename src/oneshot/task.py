@@ -207,14 +207,7 @@ class OneshotTask:
                     break
 
                 # Check for idle timeout
-                current_time = asyncio.get_event_loop().time()
-                if self.state_machine.last_activity:
-                    idle_time = current_time - self.state_machine.last_activity
-                    if (idle_time > self.idle_threshold and
-                        self.state_machine.current_state_enum == TaskState.RUNNING):
-                        old_state = self.state_machine.current_state_enum
-                        self.state_machine.detect_silence()
-                        self._notify_state_change(old_state, self.state_machine.current_state_enum)
+                self.check_idle()
 
         except asyncio.CancelledError:
             raise
@@ -222,6 +215,29 @@ class OneshotTask:
             # Log error but don't fail the task
             pass
 
+    def check_idle(self, now: Optional[float] = None) -> bool:
+        """
+        Move a running task to IDLE once it has been silent past idle_threshold.
+
+        Args:
+            now: Current time on the event loop's clock; read from the loop if omitted
+
+        Returns:
+            True if the task transitioned to IDLE
+        """
+        if not self.state_machine.last_activity:
+            return False
+        if now is None:
+            now = asyncio.get_event_loop().time()
+        idle_time = now - self.state_machine.last_activity
+        if (idle_time > self.idle_threshold and
+            self.state_machine.current_state_enum == TaskState.RUNNING):
+            old_state = self.state_machine.current_state_enum
+            self.state_machine.detect_silence()
+            self._notify_state_change(old_state, self.state_machine.current_state_enum)
+            return True
+        return False
+
     def interrupt(self):
         """Interrupt the running task."""
         self._stop_event.set()
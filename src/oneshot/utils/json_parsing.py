@@ -7,6 +7,37 @@ Functions for extracting and parsing JSON from LLM output.
 import json
 import re
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Runs of digits long enough to hold an integer outside the 64-bit range,
+# which orjson reads as a float where json keeps an exact int
+_WIDE_INT_RE = re.compile(r'[0-9]{19}')
+_WIDE_INT_BYTES_RE = re.compile(rb'[0-9]{19}')
+
+
+def loads(data):
+    """
+    Parse a JSON document into the same value json.loads would return.
+
+    orjson is used when installed. Documents it parses differently are
+    handed to json: those it rejects (NaN, Infinity, out-of-range floats,
+    lone surrogates) and those with an integer wider than 64 bits, which
+    it would turn into a float. Raises json.JSONDecodeError on invalid JSON.
+    """
+    if HAS_ORJSON:
+        wide_int = _WIDE_INT_BYTES_RE if isinstance(data, (bytes, bytearray)) else _WIDE_INT_RE
+        if not wide_int.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
 def extract_json(text):
     """
     Extract JSON from text and return the raw JSON string with preserved formatting.
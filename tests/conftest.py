@@ -1,6 +1,19 @@
 import pytest
 from unittest.mock import patch
 
+from oneshot.providers.pty_utils import SUPPORTS_PTY
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked ``pty`` when no pseudo-terminal is available."""
+    if SUPPORTS_PTY:
+        return
+    skip_pty = pytest.mark.skip(reason="PTY only supported on Unix-like systems")
+    for item in items:
+        if item.get_closest_marker("pty"):
+            item.add_marker(skip_pty)
+
+
 @pytest.fixture(autouse=True)
 def suppress_logging():
     """Suppress logging from the application during tests."""
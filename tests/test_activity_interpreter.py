@@ -216,6 +216,19 @@ More text'''
         assert objects[0]["type"] == "good"
         assert objects[1]["type"] == "also good"
 
+    def test_extract_json_objects_concatenated(self):
+        """Test extraction of adjacent objects with no separator."""
+        text = '{"type": "say", "text": "a}"}{"type": "say"}  {"n": {"m": 1}}'
+        objects = self.interpreter._extract_json_objects(text)
+
+        assert objects == [{"type": "say", "text": "a}"}, {"type": "say"}, {"n": {"m": 1}}]
+
+    @pytest.mark.timeout(5)
+    def test_extract_json_objects_unterminated(self):
+        """Test that an object cut off inside a string or escape yields nothing."""
+        assert self.interpreter._extract_json_objects('{"') == []
+        assert self.interpreter._extract_json_objects('{"text": "ab\\') == []
+
 
 class TestActivityFormatter:
     """Tests for activity formatting."""
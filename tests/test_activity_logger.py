@@ -7,7 +7,7 @@ import os
 import tempfile
 import pytest
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 
 from oneshot.providers.activity_logger import ActivityLogger
 
@@ -1,10 +1,12 @@
 """Integration tests for async refactor implementation."""
 
 import asyncio
+import inspect
 import pytest
 import time
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from oneshot.orchestrator import AsyncOrchestrator
+from oneshot.state_machine import OneshotStateMachine, TaskState
 from oneshot.task import TaskResult
 
 
@@ -85,7 +87,6 @@ async def test_orchestrator_heartbeat_monitor_exists():
     assert orchestrator.heartbeat_interval == 1.0
 
     # Verify heartbeat monitor is a coroutine method
-    import inspect
     assert inspect.iscoroutinefunction(orchestrator._heartbeat_monitor)
 
 
@@ -93,9 +94,6 @@ async def test_orchestrator_heartbeat_monitor_exists():
 @pytest.mark.timeout(10)
 async def test_state_machine_transition_integrity():
     """Test state machine transition integrity as specified in prompt."""
-    from oneshot.state_machine import OneshotStateMachine, TaskState
-    from unittest.mock import MagicMock
-
     # Create state machine with mock process
     mock_process = MagicMock()
     sm = OneshotStateMachine("test-task", mock_process)
@@ -116,9 +114,6 @@ async def test_state_machine_transition_integrity():
 @pytest.mark.timeout(15)
 async def test_silence_detection_with_timestamp_mock():
     """Test silence detection by mocking last_activity timestamp."""
-    from oneshot.state_machine import OneshotStateMachine, TaskState
-    import time
-
     sm = OneshotStateMachine("test-task")
 
     # Start the task
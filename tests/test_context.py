@@ -13,7 +13,7 @@ import os
 import tempfile
 import pytest
 from pathlib import Path
-from src.oneshot.context import ExecutionContext, StateHistoryEntry
+from oneshot.context import ExecutionContext, StateHistoryEntry
 
 
 class TestExecutionContextBasic:
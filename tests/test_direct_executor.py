@@ -121,6 +121,13 @@ class TestOllamaClient:
         client = OllamaClient()
         assert client.check_connection() is False
 
+    @patch('requests.Session.close')
+    def test_close_closes_session(self, mock_close):
+        """Test that close releases the pooled session."""
+        client = OllamaClient()
+        client.close()
+        mock_close.assert_called_once()
+
     def test_repr(self):
         """Test string representation."""
         client = OllamaClient(base_url="http://test:8080", timeout=60)
@@ -130,109 +137,105 @@ class TestOllamaClient:
 class TestDirectExecutor:
     """Test DirectExecutor functionality."""
 
-    def test_init_default(self):
-        """Test default initialization."""
-        with patch('oneshot.providers.direct_executor.OllamaClient') as mock_client:
-            executor = DirectExecutor()
-            assert executor.model == "llama-pro:latest"
-            assert executor.base_url == "http://localhost:11434"
-            assert executor.timeout == 300
-            mock_client.assert_called_once_with(base_url="http://localhost:11434", timeout=300)
-
-    def test_init_custom(self):
-        """Test custom initialization."""
+    @pytest.mark.parametrize("kwargs, expected", [
+        ({}, ("llama-pro:latest", "http://localhost:11434", 300)),
+        (
+            {"model": "custom-model", "base_url": "http://custom:8080", "timeout": 60},
+            ("custom-model", "http://custom:8080", 60),
+        ),
+    ], ids=["default", "custom"])
+    def test_init(self, kwargs, expected):
+        """Test default and custom initialization."""
+        model, base_url, timeout = expected
         with patch('oneshot.providers.direct_executor.OllamaClient') as mock_client:
-            executor = DirectExecutor(
-                model="custom-model",
-                base_url="http://custom:8080",
-                timeout=60
-            )
-            assert executor.model == "custom-model"
-            assert executor.base_url == "http://custom:8080"
-            assert executor.timeout == 60
-            mock_client.assert_called_once_with(base_url="http://custom:8080", timeout=60)
-
-    def test_run_task_success(self):
-        """Test successful task execution."""
+            executor = DirectExecutor(**kwargs)
+            assert executor.model == model
+            assert executor.base_url == base_url
+            assert executor.timeout == timeout
+            mock_client.assert_called_once_with(base_url=base_url, timeout=timeout)
+
+    @pytest.fixture
+    def mock_client(self):
+        """Patch OllamaClient and yield the client every DirectExecutor will use."""
         with patch('oneshot.providers.direct_executor.OllamaClient') as mock_client_class:
             mock_client = Mock()
             mock_client.check_connection.return_value = True
-            mock_client.generate.return_value = OllamaResponse(
-                response="42",
-                done=True,
-                total_duration=1000,
-                load_duration=500,
-                prompt_eval_count=5,
-                eval_count=10,
-                eval_duration=800
-            )
             mock_client_class.return_value = mock_client
+            yield mock_client
 
-            executor = DirectExecutor()
-            result = executor.run_task("What is 2+2?")
-
-            assert result.success is True
-            assert result.output == "42"
-            assert result.error is None
-            assert result.metadata['provider'] == 'direct'
-            assert result.metadata['model'] == 'llama-pro:latest'
-            assert result.metadata['total_duration'] == 1000
-
-            mock_client.check_connection.assert_called_once()
-            mock_client.generate.assert_called_once_with(
-                model="llama-pro:latest",
-                prompt="What is 2+2?",
-                stream=False
-            )
-
-    def test_run_task_connection_failure(self):
+    def test_run_task_success(self, mock_client):
+        """Test successful task execution."""
+        mock_client.generate.return_value = OllamaResponse(
+            response="42",
+            done=True,
+            total_duration=1000,
+            load_duration=500,
+            prompt_eval_count=5,
+            eval_count=10,
+            eval_duration=800
+        )
+
+        executor = DirectExecutor()
+        result = executor.run_task("What is 2+2?")
+
+        assert result.success is True
+        assert result.output == "42"
+        assert result.error is None
+        assert result.metadata['provider'] == 'direct'
+        assert result.metadata['model'] == 'llama-pro:latest'
+        assert result.metadata['total_duration'] == 1000
+
+        mock_client.check_connection.assert_called_once()
+        mock_client.generate.assert_called_once_with(
+            model="llama-pro:latest",
+            prompt="What is 2+2?",
+            stream=False
+        )
+
+    def test_run_task_connection_failure(self, mock_client):
         """Test connection failure handling."""
-        with patch('oneshot.providers.direct_executor.OllamaClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.check_connection.return_value = False
-            mock_client_class.return_value = mock_client
+        mock_client.check_connection.return_value = False
 
-            executor = DirectExecutor()
-            result = executor.run_task("test prompt")
+        executor = DirectExecutor()
+        result = executor.run_task("test prompt")
 
-            assert result.success is False
-            assert result.output == ''
-            assert "Cannot connect to Ollama service" in result.error
-            assert result.metadata['provider'] == 'direct'
+        assert result.success is False
+        assert result.output == ''
+        assert "Cannot connect to Ollama service" in result.error
+        assert result.metadata['provider'] == 'direct'
 
-    def test_run_task_incomplete_response(self):
+    def test_run_task_incomplete_response(self, mock_client):
         """Test incomplete response handling."""
-        with patch('oneshot.providers.direct_executor.OllamaClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.check_connection.return_value = True
-            mock_client.generate.return_value = OllamaResponse(
-                response="partial",
-                done=False
-            )
-            mock_client_class.return_value = mock_client
+        mock_client.generate.return_value = OllamaResponse(
+            response="partial",
+            done=False
+        )
 
-            executor = DirectExecutor()
-            result = executor.run_task("test prompt")
+        executor = DirectExecutor()
+        result = executor.run_task("test prompt")
 
-            assert result.success is False
-            assert result.output == ''
-            assert "incomplete or failed" in result.error
+        assert result.success is False
+        assert result.output == ''
+        assert "incomplete or failed" in result.error
 
-    def test_run_task_exception_handling(self):
+    def test_run_task_exception_handling(self, mock_client):
         """Test exception handling during execution."""
-        with patch('oneshot.providers.direct_executor.OllamaClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.check_connection.return_value = True
-            mock_client.generate.side_effect = Exception("API Error")
-            mock_client_class.return_value = mock_client
-
-            executor = DirectExecutor()
-            result = executor.run_task("test prompt")
-
-            assert result.success is False
-            assert result.output == ''
-            assert "Direct executor failed: API Error" in result.error
-            assert result.metadata['exception_type'] == 'Exception'
+        mock_client.generate.side_effect = Exception("API Error")
+
+        executor = DirectExecutor()
+        result = executor.run_task("test prompt")
+
+        assert result.success is False
+        assert result.output == ''
+        assert "Direct executor failed: API Error" in result.error
+        assert result.metadata['exception_type'] == 'Exception'
+
+    @patch('requests.Session.close')
+    def test_close_closes_client_session(self, mock_close):
+        """Test that closing the executor releases the client's pooled session."""
+        executor = DirectExecutor()
+        executor.close()
+        mock_close.assert_called_once()
 
     def test_repr(self):
         """Test string representation."""
@@ -16,8 +16,8 @@ from contextlib import contextmanager
 from oneshot.engine import OnehotEngine
 from oneshot.state import OnehotState, ActionType, StateMachine
 from oneshot.context import ExecutionContext
-from oneshot.protocol import ResultExtractor
-from oneshot.providers.base import BaseExecutor, RecoveryResult
+from oneshot.protocol import ResultExtractor, ResultSummary
+from oneshot.providers.base import BaseExecutor, ExecutionResult, RecoveryResult
 from oneshot.pipeline import InactivityTimeoutError
 
 
@@ -57,7 +57,6 @@ class MockExecutor(BaseExecutor):
 
     def run_task(self, task: str):
         """Mock run_task implementation."""
-        from oneshot.providers.base import ExecutionResult
         return ExecutionResult(
             success=True,
             output="Mock task result",
@@ -358,7 +357,6 @@ class TestPromptGeneration:
 
     def test_auditor_prompt_generation(self, engine, mock_context):
         """Test auditor prompt generation."""
-        from oneshot.protocol import ResultSummary
         result_summary = ResultSummary(result="Worker result", score=100)
         with patch.object(engine.result_extractor, 'extract_result', return_value=result_summary):
             prompt = engine._generate_auditor_prompt()
@@ -372,41 +370,19 @@ class TestPromptGeneration:
 class TestVerdictExtraction:
     """Test auditor verdict extraction."""
 
-    def test_extract_verdict_done(self, engine):
-        """Test extracting 'done' verdict."""
-        with patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.readlines.return_value = [
-                '{"data": "done"}\n'
-            ]
-            verdict = engine._extract_auditor_verdict()
-            assert verdict == "done"
-
-    def test_extract_verdict_retry(self, engine):
-        """Test extracting 'retry' verdict."""
-        with patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.readlines.return_value = [
-                '{"data": "retry needed"}\n'
-            ]
-            verdict = engine._extract_auditor_verdict()
-            assert verdict == "retry"
-
-    def test_extract_verdict_impossible(self, engine):
-        """Test extracting 'impossible' verdict."""
-        with patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.readlines.return_value = [
-                '{"data": "impossible to complete"}\n'
-            ]
-            verdict = engine._extract_auditor_verdict()
-            assert verdict == "impossible"
-
-    def test_extract_verdict_unknown(self, engine):
-        """Test extracting unknown verdict."""
-        with patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.readlines.return_value = [
-                '{"data": "unclear"}\n'
-            ]
-            verdict = engine._extract_auditor_verdict()
-            assert verdict == "unknown"
+    @pytest.mark.parametrize("line, expected", [
+        ('{"data": "done"}\n', "done"),
+        ('{"data": "retry needed"}\n', "retry"),
+        ('{"data": "impossible to complete"}\n', "impossible"),
+        ('{"data": "unclear"}\n', "unknown"),
+    ], ids=["done", "retry", "impossible", "unknown"])
+    def test_extract_verdict(self, engine, tmp_path, line, expected):
+        """Test extracting the verdict from the session log."""
+        log_path = tmp_path / "oneshot-log.json"
+        log_path.write_text(line)
+        engine.context.to_dict.return_value['session_log_path'] = str(log_path)
+
+        assert engine._extract_auditor_verdict() == expected
 
 
 class TestExitConditions:
@@ -325,6 +325,19 @@ class TestExecutorRegistry:
 class TestExecutorActivityParsing:
     """Test activity parsing for each executor."""
 
+    @pytest.mark.parametrize("text, expected", [
+        ("\x1b[31mRed text\x1b[0m", "Red text"),
+        ("\x1b[1;32mOK\x1b[0m done", "OK done"),
+        ("\x1b[2K\x1b[1Gprogress", "progress"),
+        ("\x1b]8;;https://example.com\x07Click\x1b]8;;\x07", "Click"),
+        ("\x1b]8;;https://example.com\x1b\\Click\x1b]8;;\x1b\\", "Click"),
+        ("\x1b]0;window title\x07prompt$ ", "prompt$ "),
+        ("plain", "plain"),
+    ])
+    def test_strip_ansi_colors(self, text, expected):
+        """Test that escape sequences are removed and text is kept."""
+        assert GeminiCLIExecutor()._strip_ansi_colors(text) == expected
+
     def test_cline_parse_activity(self):
         """Test Cline activity parsing."""
         executor = ClineExecutor()
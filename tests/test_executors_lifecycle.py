@@ -5,17 +5,18 @@ Tests the context manager contract and resource cleanup for all executors,
 ensuring processes are properly terminated on exit.
 """
 
+import json
 import pytest
 import subprocess
 from unittest.mock import Mock, MagicMock, patch, call
 from contextlib import contextmanager
 
-from src.oneshot.providers.base import BaseExecutor, RecoveryResult
-from src.oneshot.providers.direct_executor import DirectExecutor
-from src.oneshot.providers.cline_executor import ClineExecutor
-from src.oneshot.providers.claude_executor import ClaudeExecutor
-from src.oneshot.providers.gemini_executor import GeminiCLIExecutor
-from src.oneshot.providers.aider_executor import AiderExecutor
+from oneshot.providers.base import BaseExecutor, RecoveryResult
+from oneshot.providers.direct_executor import DirectExecutor
+from oneshot.providers.cline_executor import ClineExecutor
+from oneshot.providers.claude_executor import ClaudeExecutor
+from oneshot.providers.gemini_executor import GeminiCLIExecutor
+from oneshot.providers.aider_executor import AiderExecutor
 
 
 class TestDirectExecutorLifecycle:
@@ -118,38 +119,34 @@ class TestClineExecutorLifecycle:
             # Verify kill was called after timeout
             mock_process.kill.assert_called_once()
 
-    @patch('pathlib.Path.exists')
-    @patch('builtins.open')
-    def test_recover_from_task_files(self, mock_open, mock_exists):
+    @pytest.fixture
+    def home(self, tmp_path, monkeypatch):
+        """Point Path.home() at an empty temporary directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        return tmp_path
+
+    def test_recover_from_task_files(self, home):
         """Test recovery from Cline task state files."""
         executor = ClineExecutor()
 
-        mock_exists.return_value = True
-        mock_open.return_value.__enter__.return_value.read.return_value = '''
-        [
+        task_dir = home / ".cline" / "tasks" / "task123"
+        task_dir.mkdir(parents=True)
+        (task_dir / "ui_messages.json").write_text(json.dumps([
             {"type": "message", "text": "Starting task"},
             {"say": "completion_result", "text": "Task completed"}
-        ]
-        '''
-
-        with patch('json.load') as mock_json:
-            mock_json.return_value = [
-                {"type": "message", "text": "Starting task"},
-                {"say": "completion_result", "text": "Task completed"}
-            ]
+        ]))
 
-            result = executor.recover("task123")
+        result = executor.recover("task123")
 
-            assert isinstance(result, RecoveryResult)
-            assert result.success is True
-            assert len(result.recovered_activity) == 2
-            assert result.verdict == "DONE"
+        assert isinstance(result, RecoveryResult)
+        assert result.success is True
+        assert len(result.recovered_activity) == 2
+        assert result.verdict == "DONE"
 
-    @patch('pathlib.Path.exists')
-    def test_recover_no_task_files(self, mock_exists):
+    def test_recover_no_task_files(self, home):
         """Test recovery returns failure when task files don't exist."""
         executor = ClineExecutor()
-        mock_exists.return_value = False
 
         result = executor.recover("nonexistent123")
 
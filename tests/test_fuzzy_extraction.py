@@ -1,7 +1,8 @@
 import json
 import os
 import pytest
-from src.oneshot.protocol import ResultExtractor, ResultSummary
+import oneshot.protocol as protocol
+from oneshot.protocol import ResultExtractor, ResultSummary
 
 def test_result_summary_bool():
     summary = ResultSummary(result="test")
@@ -38,9 +39,7 @@ def test_extract_result_with_context(tmp_path):
         {"stdout": "Exiting."}
     ]
     
-    with open(log_file, "w") as f:
-        for event in events:
-            f.write(json.dumps(event) + "\n")
+    log_file.write_text("".join(json.dumps(event) + "\n" for event in events))
             
     extractor = ResultExtractor()
     summary = extractor.extract_result(str(log_file))
@@ -66,9 +65,7 @@ def test_extract_result_no_high_score(tmp_path):
         {"stdout": "the end"}
     ]
     
-    with open(log_file, "w") as f:
-        for event in events:
-            f.write(json.dumps(event) + "\n")
+    log_file.write_text("".join(json.dumps(event) + "\n" for event in events))
             
     extractor = ResultExtractor()
     summary = extractor.extract_result(str(log_file))
@@ -79,6 +76,21 @@ def test_extract_result_no_high_score(tmp_path):
     assert len(summary.leading_context) == 2
     assert len(summary.trailing_context) == 0
 
+@pytest.mark.parametrize("last_event", [
+    {"type": "state_change", "from": "WORKER_EXECUTING", "to": "AUDIT_PENDING"},
+    {},
+])
+def test_extract_result_no_high_score_empty_last_event(tmp_path, last_event):
+    log_file = tmp_path / "test-log-empty-last.json"
+
+    events = [{"stdout": "nothing interesting"}, last_event]
+
+    log_file.write_text("".join(json.dumps(event) + "\n" for event in events))
+
+    extractor = ResultExtractor()
+    # The fallback is the last event itself, not an earlier one
+    assert extractor.extract_result(str(log_file)) is None
+
 def test_extract_result_empty_log(tmp_path):
     log_file = tmp_path / "empty.json"
     log_file.write_text("")
@@ -92,3 +104,105 @@ def test_extract_result_malformed_json(tmp_path):
     
     extractor = ResultExtractor()
     assert extractor.extract_result(str(log_file)) is None
+
+def test_extract_result_reads_stdlib_json_extensions(tmp_path):
+    log_file = tmp_path / "test-log-nan.json"
+    # json.dumps writes non-finite floats as bare NaN/Infinity
+    log_file.write_text(json.dumps({"stdout": "DONE! Finished.", "ratio": float("nan")}) + "\n")
+
+    extractor = ResultExtractor()
+    summary = extractor.extract_result(str(log_file))
+
+    assert summary.result == "DONE! Finished."
+
+def test_extract_result_context_follows_latest_best(tmp_path):
+    log_file = tmp_path / "test-log-latest.json"
+
+    events = [
+        {"stdout": "step one"},
+        {"stdout": "DONE first pass"},
+        {"stdout": "between"},
+        {"stdout": "DONE second pass"},  # Same score, later wins
+        {"stdout": "after"},
+    ]
+
+    log_file.write_text("".join(json.dumps(event) + "\n" for event in events))
+
+    extractor = ResultExtractor()
+    summary = extractor.extract_result(str(log_file))
+
+    assert summary.result == "DONE second pass"
+    assert summary.leading_context == ["DONE first pass", "between"]
+    assert summary.trailing_context == ["after"]
+
+def test_extract_result_context_between_candidates(tmp_path):
+    log_file = tmp_path / "test-log-between.json"
+
+    events = [
+        {"stdout": "DONE first pass"},
+        {"stdout": "Processing..."},
+        {"stdout": "Still going..."},
+        {"stdout": "DONE second pass"},
+        {"stdout": "Exiting."},
+    ]
+
+    log_file.write_text("".join(json.dumps(event) + "\n" for event in events))
+
+    extractor = ResultExtractor()
+    summary = extractor.extract_result(str(log_file))
+
+    assert summary.result == "DONE second pass"
+    assert summary.leading_context == ["Processing...", "Still going..."]
+    assert summary.trailing_context == ["Exiting."]
+
+def test_extract_result_invalid_lines_keep_context(tmp_path):
+    log_file = tmp_path / "test-log-invalid.json"
+    log_file.write_text("\n".join([
+        json.dumps({"stdout": "DONE first pass"}),
+        json.dumps({"stdout": "Processing..."}),
+        json.dumps({"stdout": "Still going..."}),
+        "{not json}",  # Never an event, so it must not displace context
+        json.dumps({"stdout": "DONE second pass"}),
+    ]))
+
+    extractor = ResultExtractor()
+    summary = extractor.extract_result(str(log_file))
+
+    assert summary.result == "DONE second pass"
+    assert summary.leading_context == ["Processing...", "Still going..."]
+
+def test_extract_result_scores_escaped_keywords(tmp_path):
+    log_file = tmp_path / "test-log-escaped.json"
+    log_file.write_text("\n".join([
+        json.dumps({"stdout": "DONE"}),
+        json.dumps({"stdout": "Processing..."}),
+        json.dumps({"stdout": "Still going..."}),
+        # Keywords only appear once the JSON escapes are decoded
+        r'{"output": "\u0044ONE \u0053TATUS \u0053UCCESS"}',
+    ]))
+
+    extractor = ResultExtractor()
+    summary = extractor.extract_result(str(log_file))
+
+    assert summary.result == "DONE STATUS SUCCESS"
+    assert summary.leading_context == ["Processing...", "Still going..."]
+
+def test_extract_result_maps_large_logs(tmp_path, monkeypatch):
+    log_file = tmp_path / "test-log-large.json"
+    log_file.write_text("\n".join(
+        json.dumps(event) for event in [
+            {"stdout": "Working..."},
+            {"stdout": "DONE! Finished."},
+            {"stdout": "Bye."},
+        ]
+    ))
+
+    extractor = ResultExtractor()
+    bulk = extractor.extract_result(str(log_file))
+
+    # Force the memory-mapped path
+    monkeypatch.setattr(protocol, "_BULK_READ_LIMIT", 0)
+    mapped = extractor.extract_result(str(log_file))
+
+    assert mapped == bulk
+    assert mapped.result == "DONE! Finished."
@@ -1,7 +1,9 @@
 """Tests for JSON parsing and extraction functionality."""
 
+import json
 import pytest
 from oneshot.utils.json_parsing import (
+    loads,
     extract_json,
     contains_completion_indicators,
     extract_lenient_json
@@ -192,4 +194,36 @@ class TestLenientJsonParsing:
         text = "Working on the task and DONE"
         result, method = extract_lenient_json(text)
         assert result is not None
-        assert method == "lenient_fallback"
\ No newline at end of file
+        assert method == "lenient_fallback"
+
+
+class TestLoads:
+    """Test that loads parses exactly like json.loads."""
+
+    @pytest.mark.parametrize("doc", [
+        '{"status": "DONE", "files": [1, 2.5, null]}',
+        '{"ratio": NaN, "limit": Infinity, "floor": -Infinity}',
+        '{"huge": 1e400}',
+        '{"text": "\\ud800"}',
+        '{"id": 123456789012345678901234567890}',
+        '{"id": -9223372036854775809}',
+        '{"id": 18446744073709551615}',
+    ])
+    def test_loads_matches_stdlib(self, doc):
+        """Test str and bytes input against json.loads, including orjson's gaps."""
+        expected = json.loads(doc)
+        for data in (doc, doc.encode()):
+            result = loads(data)
+            assert repr(result) == repr(expected)
+
+    def test_loads_keeps_wide_ints_exact(self):
+        """Test that integers beyond 64 bits stay ints rather than floats."""
+        result = loads(b'{"id": 18446744073709551617}')
+        assert result == {"id": (1 << 64) + 1}
+        assert isinstance(result["id"], int)
+
+    @pytest.mark.parametrize("doc", ['{"a": ', b'{not json}', ''])
+    def test_loads_invalid_raises(self, doc):
+        """Test that invalid documents raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(doc)
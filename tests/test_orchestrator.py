@@ -84,7 +84,6 @@ class TestAsyncOrchestrator:
         """Test orchestrator statistics."""
         orchestrator = AsyncOrchestrator()
         # Simulate tasks by creating mock task objects
-        from oneshot.state_machine import OneshotStateMachine, TaskState
 
         task1 = OneshotTask("cmd1")
         task1.state_machine = OneshotStateMachine("task-1")
@@ -8,8 +8,7 @@ Pattern: Generator mocking and side-effect verification.
 import pytest
 import json
 import time
-import tempfile
-import os
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -30,85 +29,73 @@ from oneshot.pipeline import (
 class TestExtractJsonObjects:
     """Tests for the extract_json_objects generator."""
 
-    def test_extract_json_with_preamble(self):
-        """Test extraction of JSON with a text preamble."""
-        stream = [
-            "This is a preamble.\n",
-            "It has multiple lines.\n",
-            "{\n",
-            '  "key": "value",\n',
-            '  "status": "DONE"\n',
-            "}\n"
-        ]
-        result = list(extract_json_objects(iter(stream)))
-        
-        assert len(result) == 3
-        assert result[0] == "This is a preamble."
-        assert result[1] == "It has multiple lines."
-        assert isinstance(result[2], dict)
-        assert result[2]["status"] == "DONE"
-
-    def test_extract_multiple_json_objects(self):
-        """Test extraction of multiple JSON objects in a stream."""
-        stream = [
-            "{\n",
-            '  "id": 1\n',
-            "}\n",
-            "noise line\n",
-            "{\n",
-            '  "id": 2\n',
-            "}\n"
-        ]
-        result = list(extract_json_objects(iter(stream)))
-        
-        assert len(result) == 2
-        assert isinstance(result[0], dict)
-        assert result[0]["id"] == 1
-        assert isinstance(result[1], dict)
-        assert result[1]["id"] == 2
-
-    def test_extract_json_chunked_input(self):
-        """Test extraction when input is chunked across lines."""
-        stream = [
-            "Pre", "amble\n",
-            "{\n",
-            '  "ke', 'y": "val', 'ue"\n',
-            "}\n"
-        ]
-        result = list(extract_json_objects(iter(stream)))
-        
-        assert len(result) == 2
-        assert result[0] == "Preamble"
-        assert result[1] == {"key": "value"}
-
-    def test_extract_json_invalid_fallback(self):
-        """Test that invalid JSON is yielded as a string."""
-        stream = [
-            "{\n",
-            '  "broken": "json"\n',
-            # missing closing brace or malformed
-            "  invalid\n",
-            "}\n"
-        ]
-        result = list(extract_json_objects(iter(stream)))
-        
-        assert len(result) == 1
-        assert isinstance(result[0], str)
-        assert "broken" in result[0]
-
-    def test_extract_json_passthrough_non_strings(self):
-        """Test that non-string objects are passed through."""
-        stream = [
-            "Preamble\n",
-            {"already": "parsed"},
-            "Postamble\n"
-        ]
-        result = list(extract_json_objects(iter(stream)))
-        
-        assert len(result) == 3
-        assert result[0] == "Preamble"
-        assert result[1] == {"already": "parsed"}
-        assert result[2] == "Postamble"
+    @pytest.mark.parametrize("stream, expected", [
+        # Text preamble lines are yielded before the object
+        (
+            [
+                "This is a preamble.\n",
+                "It has multiple lines.\n",
+                "{\n",
+                '  "key": "value",\n',
+                '  "status": "DONE"\n',
+                "}\n",
+            ],
+            ["This is a preamble.", "It has multiple lines.", {"key": "value", "status": "DONE"}],
+        ),
+        # Noise between objects is dropped once the first object has started
+        (
+            ["{\n", '  "id": 1\n', "}\n", "noise line\n", "{\n", '  "id": 2\n', "}\n"],
+            [{"id": 1}, {"id": 2}],
+        ),
+        # Brace-free chunks after the first object are skipped without losing a split line
+        (
+            ['{\n  "id": 1\n}\n', "keepalive\nping", "\n{", '\n  "id": 2\n}\n'],
+            [{"id": 1}, {"id": 2}],
+        ),
+        # Lines split across chunks are reassembled
+        (
+            ["Pre", "amble\n", "{\n", '  "ke', 'y": "val', 'ue"\n', "}\n"],
+            ["Preamble", {"key": "value"}],
+        ),
+        # A single chunk may carry several complete lines
+        (
+            ['Preamble\n{\n  "id": 1\n}\n{\n  "id": 2\n}\n{\n', '  "id": 3\n}\n'],
+            ["Preamble", {"id": 1}, {"id": 2}, {"id": 3}],
+        ),
+        # Invalid JSON falls back to the raw buffered text
+        (
+            ["{\n", '  "broken": "json"\n', "  invalid\n", "}\n"],
+            ['{\n  "broken": "json"\n  invalid\n}\n'],
+        ),
+        # Non-string items pass straight through
+        (
+            ["Preamble\n", {"already": "parsed"}, "Postamble\n"],
+            ["Preamble", {"already": "parsed"}, "Postamble"],
+        ),
+        # Integers beyond 64 bits stay exact and non-finite numbers parse,
+        # as with json.loads
+        (
+            ["{\n", '  "id": 18446744073709551617\n', "}\n"],
+            [{"id": (1 << 64) + 1}],
+        ),
+        (
+            ["{\n", '  "limit": Infinity\n', "}\n"],
+            [{"limit": float("inf")}],
+        ),
+    ], ids=[
+        "preamble",
+        "multiple_objects",
+        "noise_without_braces",
+        "chunked_input",
+        "many_lines_in_one_chunk",
+        "invalid_fallback",
+        "passthrough_non_strings",
+        "wide_int",
+        "non_finite",
+    ])
+    def test_extract_json_objects(self, stream, expected):
+        """Test extraction of JSON objects and text lines from a stream."""
+        assert list(extract_json_objects(iter(stream))) == expected
 
 
 class TestIngestStream:
@@ -259,77 +246,95 @@ class TestInactivityMonitor:
 class TestLogActivity:
     """Tests for the log_activity generator."""
 
-    def test_log_activity_writes_ndjson(self):
+    def test_log_activity_writes_ndjson(self, tmp_path):
         """Test that log_activity writes valid NDJSON."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
+        log_path = str(tmp_path / "oneshot-log.json")
+
+        def data_gen():
+            yield TimestampedActivity(1000.0, "data1", executor="claude")
+            yield TimestampedActivity(1001.0, "data2", executor="claude")
 
-        try:
-            def data_gen():
-                yield TimestampedActivity(1000.0, "data1", executor="claude")
-                yield TimestampedActivity(1001.0, "data2", executor="claude")
+        result = list(log_activity(data_gen(), log_path))
+        assert len(result) == 2
 
-            result = list(log_activity(data_gen(), log_path))
-            assert len(result) == 2
+        # Verify NDJSON format
+        with open(log_path, 'r') as f:
+            lines = f.readlines()
+        assert len(lines) == 2
 
-            # Verify NDJSON format
-            with open(log_path, 'r') as f:
-                lines = f.readlines()
-            assert len(lines) == 2
+        # Parse each line as JSON
+        for line in lines:
+            parsed = json.loads(line)
+            assert "timestamp" in parsed
+            assert "data" in parsed
+            assert "executor" in parsed
 
-            # Parse each line as JSON
-            for line in lines:
-                parsed = json.loads(line)
-                assert "timestamp" in parsed
-                assert "data" in parsed
-                assert "executor" in parsed
-        finally:
-            os.unlink(log_path)
+    def test_log_activity_serializes_arbitrary_data(self, tmp_path):
+        """Test that values JSON cannot represent natively still produce a line."""
+        log_path = tmp_path / "oneshot-log.json"
 
-    def test_log_activity_flushes_on_write(self):
+        def data_gen():
+            yield TimestampedActivity(1000.0, {1: "int key", "big": 1 << 70})
+            yield TimestampedActivity(1001.0, {"obj": object(), "text": "caf\u00e9"})
+
+        list(log_activity(data_gen(), str(log_path)))
+
+        first, second = [json.loads(line) for line in log_path.read_bytes().splitlines()]
+        assert first["data"] == {"1": "int key", "big": 1 << 70}
+        assert second["data"]["obj"].startswith("<object object")
+        assert second["data"]["text"] == "caf\u00e9"
+
+    def test_log_activity_writes_stdlib_json(self, tmp_path):
+        """Test that each line is exactly what json.dumps(..., default=str) writes."""
+        log_path = tmp_path / "oneshot-log.json"
+        activity = TimestampedActivity(
+            1000.0,
+            {"at": datetime(2024, 1, 2, 3, 4, 5), "ratio": float("nan"), "text": "caf\u00e9"},
+        )
+
+        list(log_activity(iter([activity]), str(log_path)))
+
+        assert log_path.read_text() == (
+            '{"timestamp": 1000.0, "data": {"at": "2024-01-02 03:04:05", "ratio": NaN, '
+            '"text": "caf\\u00e9"}, "executor": null, "is_heartbeat": false}\n'
+        )
+
+    def test_log_activity_flushes_on_write(self, tmp_path):
         """Test that log_activity flushes after each write."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
-
-        try:
-            def data_gen():
-                yield TimestampedActivity(1000.0, "data1")
-                yield TimestampedActivity(1001.0, "data2")
-
-            # Start consuming the generator
-            gen = log_activity(data_gen(), log_path)
-            first = next(gen)
-
-            # Check that first item was written and flushed
-            with open(log_path, 'r') as f:
-                lines = f.readlines()
-            assert len(lines) == 1
-
-            # Consume rest
-            list(gen)
-
-            # Check that all items were written
-            with open(log_path, 'r') as f:
-                lines = f.readlines()
-            assert len(lines) == 2
-        finally:
-            os.unlink(log_path)
-
-    def test_log_activity_passthrough(self):
+        log_path = str(tmp_path / "oneshot-log.json")
+
+        def data_gen():
+            yield TimestampedActivity(1000.0, "data1")
+            yield TimestampedActivity(1001.0, "data2")
+
+        # Start consuming the generator
+        gen = log_activity(data_gen(), log_path)
+        first = next(gen)
+
+        # Check that first item was written and flushed
+        with open(log_path, 'r') as f:
+            lines = f.readlines()
+        assert len(lines) == 1
+
+        # Consume rest
+        list(gen)
+
+        # Check that all items were written
+        with open(log_path, 'r') as f:
+            lines = f.readlines()
+        assert len(lines) == 2
+
+    def test_log_activity_passthrough(self, tmp_path):
         """Test that log_activity passes items through unchanged."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
+        log_path = str(tmp_path / "oneshot-log.json")
 
-        try:
-            items = [
-                TimestampedActivity(1000.0, "data1"),
-                TimestampedActivity(1001.0, "data2"),
-            ]
+        items = [
+            TimestampedActivity(1000.0, "data1"),
+            TimestampedActivity(1001.0, "data2"),
+        ]
 
-            result = list(log_activity(iter(items), log_path))
-            assert result == items
-        finally:
-            os.unlink(log_path)
+        result = list(log_activity(iter(items), log_path))
+        assert result == items
 
     def test_log_activity_handles_missing_directory(self):
         """Test log_activity error handling for invalid path."""
@@ -341,26 +346,22 @@ class TestLogActivity:
         with pytest.raises(RuntimeError):
             list(log_activity(data_gen(), invalid_path))
 
-    def test_log_activity_serializes_complex_data(self):
+    def test_log_activity_serializes_complex_data(self, tmp_path):
         """Test that complex data types are serialized correctly."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
+        log_path = str(tmp_path / "oneshot-log.json")
 
-        try:
-            def data_gen():
-                yield TimestampedActivity(1000.0, {"key": "value", "nested": [1, 2, 3]})
-                yield TimestampedActivity(1001.0, [1, 2, 3])
-                yield TimestampedActivity(1002.0, None)
+        def data_gen():
+            yield TimestampedActivity(1000.0, {"key": "value", "nested": [1, 2, 3]})
+            yield TimestampedActivity(1001.0, [1, 2, 3])
+            yield TimestampedActivity(1002.0, None)
 
-            list(log_activity(data_gen(), log_path))
+        list(log_activity(data_gen(), log_path))
 
-            # Verify all lines are valid JSON
-            with open(log_path, 'r') as f:
-                for line in f:
-                    parsed = json.loads(line)
-                    assert parsed["data"] is not None or parsed["data"] is None
-        finally:
-            os.unlink(log_path)
+        # Verify all lines are valid JSON
+        with open(log_path, 'r') as f:
+            for line in f:
+                parsed = json.loads(line)
+                assert parsed["data"] is not None or parsed["data"] is None
 
 
 class TestParseActivity:
@@ -409,128 +410,105 @@ class TestParseActivity:
 class TestBuildPipeline:
     """Tests for the complete pipeline composition."""
 
-    def test_build_pipeline_complete_flow(self):
+    def test_build_pipeline_complete_flow(self, tmp_path):
         """Test that the complete pipeline processes data correctly."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
+        log_path = str(tmp_path / "oneshot-log.json")
 
-        try:
-            stream = iter(["data1\n", "data2\n", "data3\n"])
-            result = list(build_pipeline(stream, log_path, inactivity_timeout=10.0))
+        stream = iter(["data1\n", "data2\n", "data3\n"])
+        result = list(build_pipeline(stream, log_path, inactivity_timeout=10.0))
 
-            assert len(result) == 3
-            for item in result:
-                assert "timestamp" in item
-                assert "data" in item
-                assert "executor" in item
+        assert len(result) == 3
+        for item in result:
+            assert "timestamp" in item
+            assert "data" in item
+            assert "executor" in item
 
-            # Verify log file was created and contains NDJSON
-            with open(log_path, 'r') as f:
-                lines = f.readlines()
-            assert len(lines) == 3
+        # Verify log file was created and contains NDJSON
+        with open(log_path, 'r') as f:
+            lines = f.readlines()
+        assert len(lines) == 3
 
-            for line in lines:
-                parsed = json.loads(line)
-                assert "timestamp" in parsed
-                assert "data" in parsed
-        finally:
-            os.unlink(log_path)
+        for line in lines:
+            parsed = json.loads(line)
+            assert "timestamp" in parsed
+            assert "data" in parsed
 
-    def test_build_pipeline_with_executor_name(self):
+    def test_build_pipeline_with_executor_name(self, tmp_path):
         """Test pipeline with executor name."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
-
-        try:
-            stream = iter(["data1"])
-            result = list(build_pipeline(
-                stream, log_path,
-                inactivity_timeout=10.0,
-                executor_name="aider"
-            ))
-
-            assert result[0]["executor"] == "aider"
-
-            # Verify in log
-            with open(log_path, 'r') as f:
-                line = f.readline()
-            parsed = json.loads(line)
-            assert parsed["executor"] == "aider"
-        finally:
-            os.unlink(log_path)
+        log_path = str(tmp_path / "oneshot-log.json")
+
+        stream = iter(["data1"])
+        result = list(build_pipeline(
+            stream, log_path,
+            inactivity_timeout=10.0,
+            executor_name="aider"
+        ))
+
+        assert result[0]["executor"] == "aider"
 
-    def test_build_pipeline_timeout_propagates(self):
+        # Verify in log
+        with open(log_path, 'r') as f:
+            line = f.readline()
+        parsed = json.loads(line)
+        assert parsed["executor"] == "aider"
+
+    def test_build_pipeline_timeout_propagates(self, tmp_path):
         """Test that inactivity timeout propagates through pipeline."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
+        log_path = str(tmp_path / "oneshot-log.json")
 
-        try:
-            def slow_stream():
-                yield "data1"
-                time.sleep(1.0)  # Exceed timeout
-                yield "data2"
+        def slow_stream():
+            yield "data1"
+            time.sleep(1.0)  # Exceed timeout
+            yield "data2"
 
-            with pytest.raises(InactivityTimeoutError):
-                list(build_pipeline(slow_stream(), log_path, inactivity_timeout=0.5))
-        finally:
-            os.unlink(log_path)
+        with pytest.raises(InactivityTimeoutError):
+            list(build_pipeline(slow_stream(), log_path, inactivity_timeout=0.5))
 
 
 class TestValidateNdjson:
     """Tests for NDJSON validation."""
 
-    def test_validate_ndjson_valid_file(self):
+    def test_validate_ndjson_valid_file(self, tmp_path):
         """Test validation of valid NDJSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            f.write('{"key": "value1"}\n')
-            f.write('{"key": "value2"}\n')
-            f.write('{"key": "value3"}\n')
-            log_path = f.name
-
-        try:
-            assert validate_ndjson(log_path) is True
-        finally:
-            os.unlink(log_path)
-
-    def test_validate_ndjson_with_empty_lines(self):
+        log_path = tmp_path / "log.json"
+        log_path.write_bytes(b'{"key": "value1"}\n{"key": "value2"}\n{"key": "value3"}\n')
+
+        assert validate_ndjson(str(log_path)) is True
+
+    def test_validate_ndjson_with_empty_lines(self, tmp_path):
         """Test validation with empty lines (should pass)."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            f.write('{"key": "value1"}\n')
-            f.write('\n')
-            f.write('{"key": "value2"}\n')
-            log_path = f.name
-
-        try:
-            assert validate_ndjson(log_path) is True
-        finally:
-            os.unlink(log_path)
-
-    def test_validate_ndjson_invalid_file(self):
+        log_path = tmp_path / "log.json"
+        log_path.write_bytes(b'{"key": "value1"}\n\n{"key": "value2"}\n')
+
+        assert validate_ndjson(str(log_path)) is True
+
+    def test_validate_ndjson_invalid_file(self, tmp_path):
         """Test validation detects invalid JSON."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            f.write('{"key": "value1"}\n')
-            f.write('not valid json}\n')
-            f.write('{"key": "value2"}\n')
-            log_path = f.name
+        log_path = tmp_path / "log.json"
+        log_path.write_bytes(b'{"key": "value1"}\nnot valid json}\n{"key": "value2"}\n')
+
+        assert validate_ndjson(str(log_path)) is False
+
+    def test_validate_ndjson_accepts_stdlib_output(self, tmp_path):
+        """Test that lines json.dumps writes, such as NaN, count as valid."""
+        log_path = tmp_path / "log.json"
+        log_path.write_text(
+            json.dumps({"ratio": float("nan")}) + "\n"
+            + json.dumps({"id": (1 << 64) + 1, "text": "\ud800"}) + "\n"
+        )
 
-        try:
-            assert validate_ndjson(log_path) is False
-        finally:
-            os.unlink(log_path)
+        assert validate_ndjson(str(log_path)) is True
 
     def test_validate_ndjson_nonexistent_file(self):
         """Test validation of nonexistent file."""
         assert validate_ndjson("/nonexistent/path.json") is False
 
-    def test_validate_ndjson_empty_file(self):
+    def test_validate_ndjson_empty_file(self, tmp_path):
         """Test validation of empty file."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
+        log_path = tmp_path / "oneshot-log.json"
+        log_path.touch()
 
-        try:
-            assert validate_ndjson(log_path) is True
-        finally:
-            os.unlink(log_path)
+        assert validate_ndjson(str(log_path)) is True
 
 
 class TestTimestampedActivityDataclass:
@@ -564,68 +542,60 @@ class TestTimestampedActivityDataclass:
 class TestIntegration:
     """Integration tests for the pipeline."""
 
-    def test_end_to_end_pipeline(self):
+    def test_end_to_end_pipeline(self, tmp_path):
         """Test complete end-to-end pipeline execution."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
-
-        try:
-            # Create a realistic stream
-            test_data = [
-                "Starting execution\n",
-                "Processing request\n",
-                "Generating output\n",
-                "Done\n"
-            ]
-
-            # Run through full pipeline
-            result = list(build_pipeline(
-                iter(test_data),
-                log_path,
-                inactivity_timeout=5.0,
-                executor_name="test-executor"
-            ))
-
-            # Verify output
-            assert len(result) == 4
-            assert all("timestamp" in item for item in result)
-            assert all(item["executor"] == "test-executor" for item in result)
-
-            # Verify log is valid NDJSON
-            assert validate_ndjson(log_path)
-
-            # Verify log content
-            with open(log_path, 'r') as f:
-                lines = f.readlines()
-            assert len(lines) == 4
-
-            for line in lines:
-                parsed = json.loads(line)
-                assert parsed["executor"] == "test-executor"
-        finally:
-            os.unlink(log_path)
+        log_path = str(tmp_path / "oneshot-log.json")
+
+        # Create a realistic stream
+        test_data = [
+            "Starting execution\n",
+            "Processing request\n",
+            "Generating output\n",
+            "Done\n"
+        ]
+
+        # Run through full pipeline
+        result = list(build_pipeline(
+            iter(test_data),
+            log_path,
+            inactivity_timeout=5.0,
+            executor_name="test-executor"
+        ))
 
-    def test_pipeline_with_complex_data_types(self):
+        # Verify output
+        assert len(result) == 4
+        assert all("timestamp" in item for item in result)
+        assert all(item["executor"] == "test-executor" for item in result)
+
+        # Verify log is valid NDJSON
+        assert validate_ndjson(log_path)
+
+        # Verify log content
+        with open(log_path, 'r') as f:
+            lines = f.readlines()
+        assert len(lines) == 4
+
+        for line in lines:
+            parsed = json.loads(line)
+            assert parsed["executor"] == "test-executor"
+
+    def test_pipeline_with_complex_data_types(self, tmp_path):
         """Test pipeline with various data types."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            log_path = f.name
-
-        try:
-            test_data = [
-                {"type": "dict", "value": 123},
-                [1, 2, 3],
-                "simple string",
-                42,
-                None,
-            ]
-
-            result = list(build_pipeline(
-                iter(test_data),
-                log_path,
-                inactivity_timeout=5.0
-            ))
-
-            assert len(result) == 5
-            assert validate_ndjson(log_path)
-        finally:
-            os.unlink(log_path)
+        log_path = str(tmp_path / "oneshot-log.json")
+
+        test_data = [
+            {"type": "dict", "value": 123},
+            [1, 2, 3],
+            "simple string",
+            42,
+            None,
+        ]
+
+        result = list(build_pipeline(
+            iter(test_data),
+            log_path,
+            inactivity_timeout=5.0
+        ))
+
+        assert len(result) == 5
+        assert validate_ndjson(log_path)
@@ -2,11 +2,14 @@
 
 import pytest
 import subprocess
-from oneshot.providers.pty_utils import call_executor_pty
-import platform
+from oneshot.providers.pty_utils import (
+    DEFAULT_ACCUMULATION_BUFFER_SIZE,
+    DEFAULT_BUFFER_SIZE,
+    call_executor_pty,
+)
 
 
-@pytest.mark.skipif(platform.system() not in ('Linux', 'Darwin'), reason="PTY only supported on Unix-like systems")
+@pytest.mark.pty
 def test_pty_streaming_with_echo():
     """Test PTY streaming with a simple echo command."""
     # Test basic PTY functionality - focus on output capture, not exit code
@@ -18,7 +21,7 @@ def test_pty_streaming_with_echo():
     # Note: Exit code reporting has a known issue in PTY implementation
 
 
-@pytest.mark.skipif(platform.system() not in ('Linux', 'Darwin'), reason="PTY only supported on Unix-like systems")
+@pytest.mark.pty
 def test_pty_streaming_with_multiline_output():
     """Test PTY streaming with multiline output."""
     # Use printf to generate multiple lines
@@ -32,7 +35,7 @@ def test_pty_streaming_with_multiline_output():
     assert len(lines) >= 3
 
 
-@pytest.mark.skipif(platform.system() not in ('Linux', 'Darwin'), reason="PTY only supported on Unix-like systems")
+@pytest.mark.pty
 def test_pty_streaming_timeout():
     """Test PTY streaming timeout handling."""
     # Use sleep command that should timeout
@@ -45,10 +48,15 @@ def test_pty_function_exists_and_is_callable():
     # This tests the basic infrastructure without platform-specific issues
     assert callable(call_executor_pty)
 
-    # Test that the function has the expected signature
-    import inspect
-    sig = inspect.signature(call_executor_pty)
-    params = list(sig.parameters.keys())
+    # Test that the function has the expected positional parameters
+    code = call_executor_pty.__code__
+    params = code.co_varnames[:code.co_argcount]
     assert 'cmd' in params
     assert 'input_data' in params
-    assert 'timeout' in params
\ No newline at end of file
+    assert 'timeout' in params
+
+    # Buffer sizes default to the module-level constants
+    assert call_executor_pty.__defaults__[-2:] == (
+        DEFAULT_BUFFER_SIZE,
+        DEFAULT_ACCUMULATION_BUFFER_SIZE,
+    )
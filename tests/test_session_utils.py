@@ -0,0 +1,47 @@
+"""Tests for CLI session file helpers."""
+
+import json
+
+from oneshot.cli.session_utils import count_iterations, find_latest_session
+
+
+def test_find_latest_session(tmp_path):
+    """Test that the session with the greatest timestamped name wins."""
+    for name in (
+        "session_2023-01-01_10-00-00.md",
+        "session_2023-01-01_11-00-00.md",
+        "session_2023-01-01_09-00-00.md",
+        "2023-01-01_10-30-00_oneshot.json",
+        "notes.md",
+    ):
+        (tmp_path / name).open("w").close()
+
+    assert find_latest_session(tmp_path) == tmp_path / "session_2023-01-01_11-00-00.md"
+
+
+def test_find_latest_session_no_files(tmp_path):
+    """Test that a directory without session files yields None."""
+    (tmp_path / "notes.md").open("w").close()
+
+    assert find_latest_session(tmp_path) is None
+    assert find_latest_session(tmp_path / "missing") is None
+
+
+def test_count_iterations(tmp_path):
+    """Test that JSON sessions report their stored iteration count."""
+    session = tmp_path / "2023-01-01_10-00-00_oneshot.json"
+    session.write_text(json.dumps({"state": "RUNNING", "iteration_count": 3}))
+
+    assert count_iterations(session) == 3
+
+
+def test_count_iterations_without_count(tmp_path):
+    """Test that legacy, empty and unreadable sessions count as zero."""
+    legacy = tmp_path / "session_2023-01-01_10-00-00.md"
+    legacy.write_text("## Iteration 1\n")
+    empty = tmp_path / "empty_oneshot.json"
+    empty.open("w").close()
+
+    assert count_iterations(legacy) == 0
+    assert count_iterations(empty) == 0
+    assert count_iterations(tmp_path / "missing_oneshot.json") == 0
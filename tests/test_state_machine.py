@@ -104,13 +104,11 @@ class TestStateMachine:
 
     def test_state_machine_activity_tracking(self):
         """Test last_activity updates."""
-        sm = OneshotStateMachine("test-task")
+        sm = OneshotStateMachine("test-task", clock=iter([1.0, 2.0]).__next__)
         sm.start()
-        initial_time = sm.last_activity
-        import time
-        time.sleep(0.01)
+        assert sm.last_activity == 1.0
         sm.update_activity()
-        assert sm.last_activity > initial_time
+        assert sm.last_activity == 2.0
 
     def test_state_machine_can_interrupt_running(self):
         """Test can_interrupt returns True for RUNNING."""
@@ -13,6 +13,12 @@ from oneshot.state import (
 )
 
 
+@pytest.fixture(scope="module")
+def sm():
+    """Shared StateMachine; transition() and get_next_action() keep no state."""
+    return StateMachine()
+
+
 class TestOnehotState:
     """Test OnehotState enumeration."""
 
@@ -49,6 +55,12 @@ class TestActionType:
         for action_type in required_types:
             assert action_type in ActionType
 
+    def test_action_types_are_distinct_from_states(self):
+        """Verify action types never compare equal to states or plain ints."""
+        assert ActionType.RUN_WORKER != OnehotState.CREATED
+        assert ActionType.RUN_WORKER.value == OnehotState.CREATED.value
+        assert ActionType.RUN_WORKER != ActionType.RUN_WORKER.value
+
 
 class TestAction:
     """Test Action dataclass."""
@@ -66,387 +78,207 @@ class TestAction:
         assert action.type == ActionType.EXIT
         assert action.payload == payload
 
+    def test_action_default_payload_is_shared(self):
+        """Test that payload-free actions share one read-only empty payload."""
+        action = Action(ActionType.WAIT)
+        assert action.payload is Action(ActionType.RUN_WORKER).payload
+        with pytest.raises(TypeError):
+            action.payload["reason"] = "changed"
+
+
+# (current state, event, expected next state) for every valid transition
+_TRANSITION_CASES = [
+    (OnehotState.CREATED, "start", OnehotState.WORKER_EXECUTING),
+    (OnehotState.WORKER_EXECUTING, "success", OnehotState.AUDIT_PENDING),
+    (OnehotState.WORKER_EXECUTING, "crash", OnehotState.RECOVERY_PENDING),
+    (OnehotState.WORKER_EXECUTING, "inactivity", OnehotState.RECOVERY_PENDING),
+    (OnehotState.AUDIT_PENDING, "next", OnehotState.AUDITOR_EXECUTING),
+    (OnehotState.AUDITOR_EXECUTING, "done", OnehotState.COMPLETED),
+    (OnehotState.AUDITOR_EXECUTING, "retry", OnehotState.REITERATION_PENDING),
+    (OnehotState.AUDITOR_EXECUTING, "impossible", OnehotState.REJECTED),
+    (OnehotState.AUDITOR_EXECUTING, "crash", OnehotState.FAILED),
+    (OnehotState.AUDITOR_EXECUTING, "inactivity", OnehotState.FAILED),
+    (OnehotState.REITERATION_PENDING, "next", OnehotState.WORKER_EXECUTING),
+    (OnehotState.REITERATION_PENDING, "max_iterations", OnehotState.FAILED),
+    (OnehotState.RECOVERY_PENDING, "zombie_success", OnehotState.AUDIT_PENDING),
+    (OnehotState.RECOVERY_PENDING, "zombie_partial", OnehotState.REITERATION_PENDING),
+    (OnehotState.RECOVERY_PENDING, "zombie_dead", OnehotState.FAILED),
+    (OnehotState.CREATED, "interrupt", OnehotState.INTERRUPTED),
+    (OnehotState.WORKER_EXECUTING, "interrupt", OnehotState.INTERRUPTED),
+    (OnehotState.AUDIT_PENDING, "interrupt", OnehotState.INTERRUPTED),
+    (OnehotState.AUDITOR_EXECUTING, "interrupt", OnehotState.INTERRUPTED),
+    (OnehotState.REITERATION_PENDING, "interrupt", OnehotState.INTERRUPTED),
+    (OnehotState.RECOVERY_PENDING, "interrupt", OnehotState.INTERRUPTED),
+]
+
 
 class TestStateMachineTransitions:
     """Table-driven tests for state transitions."""
 
-    def test_lifecycle_transitions(self):
-        """Test lifecycle state transitions."""
-        sm = StateMachine()
-
-        # CREATED -> WORKER_EXECUTING
-        next_state = sm.transition(OnehotState.CREATED, "start")
-        assert next_state == OnehotState.WORKER_EXECUTING
-
-        # WORKER_EXECUTING -> AUDIT_PENDING (Success)
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "success")
-        assert next_state == OnehotState.AUDIT_PENDING
-
-        # AUDIT_PENDING -> AUDITOR_EXECUTING
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        assert next_state == OnehotState.AUDITOR_EXECUTING
-
-        # AUDITOR_EXECUTING -> COMPLETED (Done)
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "done")
-        assert next_state == OnehotState.COMPLETED
-
-    def test_worker_crash_transitions(self):
-        """Test transitions after worker crash."""
-        sm = StateMachine()
-
-        # WORKER_EXECUTING -> RECOVERY_PENDING (Crash)
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "crash")
-        assert next_state == OnehotState.RECOVERY_PENDING
-
-        # WORKER_EXECUTING -> RECOVERY_PENDING (Inactivity)
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "inactivity")
-        assert next_state == OnehotState.RECOVERY_PENDING
-
-    def test_active_transitions(self):
-        """Test active state transitions."""
-        sm = StateMachine()
-
-        # AUDIT_PENDING -> AUDITOR_EXECUTING
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        assert next_state == OnehotState.AUDITOR_EXECUTING
-
-        # AUDITOR_EXECUTING -> COMPLETED (Done)
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "done")
-        assert next_state == OnehotState.COMPLETED
-
-        # AUDITOR_EXECUTING -> REITERATION_PENDING (Retry)
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "retry")
-        assert next_state == OnehotState.REITERATION_PENDING
-
-        # AUDITOR_EXECUTING -> REJECTED (Impossible)
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "impossible")
-        assert next_state == OnehotState.REJECTED
-
-    def test_recovery_transitions(self):
-        """Test recovery state transitions."""
-        sm = StateMachine()
-
-        # WORKER_EXECUTING -> RECOVERY_PENDING
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "crash")
-        assert next_state == OnehotState.RECOVERY_PENDING
-
-        # RECOVERY_PENDING -> AUDIT_PENDING (Zombie Success)
-        next_state = sm.transition(OnehotState.RECOVERY_PENDING, "zombie_success")
-        assert next_state == OnehotState.AUDIT_PENDING
-
-        # RECOVERY_PENDING -> REITERATION_PENDING (Zombie Partial)
-        next_state = sm.transition(OnehotState.RECOVERY_PENDING, "zombie_partial")
-        assert next_state == OnehotState.REITERATION_PENDING
-
-        # RECOVERY_PENDING -> FAILED (Zombie Dead)
-        next_state = sm.transition(OnehotState.RECOVERY_PENDING, "zombie_dead")
-        assert next_state == OnehotState.FAILED
-
-    def test_reiteration_transitions(self):
-        """Test reiteration state transitions."""
-        sm = StateMachine()
-
-        # REITERATION_PENDING -> WORKER_EXECUTING
-        next_state = sm.transition(OnehotState.REITERATION_PENDING, "next")
-        assert next_state == OnehotState.WORKER_EXECUTING
-
-        # REITERATION_PENDING -> FAILED (Max Iterations)
-        next_state = sm.transition(OnehotState.REITERATION_PENDING, "max_iterations")
-        assert next_state == OnehotState.FAILED
-
-    def test_interrupt_transitions(self):
-        """Test interrupt transitions from various states."""
-        sm = StateMachine()
-
-        # CREATED -> INTERRUPTED
-        next_state = sm.transition(OnehotState.CREATED, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-        # WORKER_EXECUTING -> INTERRUPTED
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-        # AUDIT_PENDING -> INTERRUPTED
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-        # AUDITOR_EXECUTING -> INTERRUPTED
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-        # REITERATION_PENDING -> INTERRUPTED
-        next_state = sm.transition(OnehotState.REITERATION_PENDING, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-        # RECOVERY_PENDING -> INTERRUPTED
-        next_state = sm.transition(OnehotState.RECOVERY_PENDING, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-    def test_auditor_crash_transitions(self):
-        """Test transitions when auditor crashes."""
-        sm = StateMachine()
-
-        # AUDITOR_EXECUTING -> FAILED (Crash)
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "crash")
-        assert next_state == OnehotState.FAILED
-
-        # AUDITOR_EXECUTING -> FAILED (Inactivity)
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "inactivity")
-        assert next_state == OnehotState.FAILED
-
-    def test_terminal_states_no_transitions(self):
-        """Test that terminal states have no valid transitions."""
-        sm = StateMachine()
-        terminal_states = [
-            OnehotState.COMPLETED,
-            OnehotState.FAILED,
-            OnehotState.REJECTED,
-        ]
-        for state in terminal_states:
-            # Try various events that should fail
-            with pytest.raises(InvalidTransitionError):
-                sm.transition(state, "any_event")
-
-    def test_invalid_transition_rejected_to_retry(self):
-        """Test that invalid transition raises error."""
-        sm = StateMachine()
+    @pytest.mark.parametrize(
+        "current, event, expected",
+        _TRANSITION_CASES,
+        ids=[f"{current.name}-{event}" for current, event, _ in _TRANSITION_CASES],
+    )
+    def test_transition(self, sm, current, event, expected):
+        """Test each valid transition from the table."""
+        assert sm.transition(current, event) == expected
+
+    @pytest.mark.parametrize("current, event", [
+        # Terminal states have no valid transitions
+        (OnehotState.COMPLETED, "any_event"),
+        (OnehotState.FAILED, "any_event"),
+        (OnehotState.REJECTED, "any_event"),
+        # Cannot transition from COMPLETED to REITERATION_PENDING
+        (OnehotState.COMPLETED, "retry"),
+        # Cannot jump from CREATED directly to AUDIT_PENDING
+        (OnehotState.CREATED, "success"),
+        # Unknown event name
+        (OnehotState.WORKER_EXECUTING, "invalid_event"),
+    ])
+    def test_invalid_transition(self, sm, current, event):
+        """Test that invalid transitions raise an error."""
         with pytest.raises(InvalidTransitionError):
-            # Cannot transition from COMPLETED to REITERATION_PENDING
-            sm.transition(OnehotState.COMPLETED, "retry")
+            sm.transition(current, event)
 
-    def test_invalid_transition_created_to_audit(self):
-        """Test that invalid transition raises error."""
-        sm = StateMachine()
-        with pytest.raises(InvalidTransitionError):
-            # Cannot jump from CREATED directly to AUDIT_PENDING
-            sm.transition(OnehotState.CREATED, "success")
+    def test_invalid_transition_error_details(self, sm):
+        """Test that the error carries the rejected state and event."""
+        with pytest.raises(InvalidTransitionError) as exc_info:
+            sm.transition(OnehotState.COMPLETED, "retry")
 
-    def test_invalid_event_name(self):
-        """Test that invalid event name raises error."""
-        sm = StateMachine()
-        with pytest.raises(InvalidTransitionError):
-            sm.transition(OnehotState.WORKER_EXECUTING, "invalid_event")
+        assert exc_info.value.state == OnehotState.COMPLETED
+        assert exc_info.value.event_type == "retry"
+        assert str(exc_info.value) == "Invalid transition: (COMPLETED, retry)"
 
 
 class TestStateMachineActions:
     """Test action logic based on current state."""
 
-    def test_action_for_created_state(self):
+    def test_action_for_created_state(self, sm):
         """Test action when in CREATED state."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.CREATED)
         assert action.type == ActionType.RUN_WORKER
 
-    def test_action_for_worker_executing_state(self):
+    def test_action_for_worker_executing_state(self, sm):
         """Test action when worker is executing."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.WORKER_EXECUTING)
         assert action.type == ActionType.WAIT
 
-    def test_action_for_audit_pending_state(self):
+    def test_action_for_audit_pending_state(self, sm):
         """Test action when audit is pending."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.AUDIT_PENDING)
         assert action.type == ActionType.RUN_AUDITOR
 
-    def test_action_for_auditor_executing_state(self):
+    def test_action_for_auditor_executing_state(self, sm):
         """Test action when auditor is executing."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.AUDITOR_EXECUTING)
         assert action.type == ActionType.WAIT
 
-    def test_action_for_reiteration_pending_state(self):
+    def test_action_for_reiteration_pending_state(self, sm):
         """Test action when reiteration is pending."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.REITERATION_PENDING)
         assert action.type == ActionType.RUN_WORKER
 
-    def test_action_for_recovery_pending_state(self):
+    def test_action_for_recovery_pending_state(self, sm):
         """Test action when recovery is pending."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.RECOVERY_PENDING)
         assert action.type == ActionType.RECOVER
 
-    def test_action_for_completed_state(self):
+    def test_action_for_completed_state(self, sm):
         """Test action when task is completed."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.COMPLETED)
         assert action.type == ActionType.EXIT
         assert action.payload.get("reason") == "success"
 
-    def test_action_for_rejected_state(self):
+    def test_action_for_rejected_state(self, sm):
         """Test action when task is rejected."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.REJECTED)
         assert action.type == ActionType.EXIT
         assert action.payload.get("reason") == "success"
 
-    def test_action_for_failed_state(self):
+    def test_action_for_failed_state(self, sm):
         """Test action when task fails."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.FAILED)
         assert action.type == ActionType.EXIT
         assert action.payload.get("reason") == "failed"
 
-    def test_action_for_interrupted_state(self):
+    def test_action_for_interrupted_state(self, sm):
         """Test action when task is interrupted."""
-        sm = StateMachine()
         action = sm.get_next_action(OnehotState.INTERRUPTED)
         assert action.type == ActionType.EXIT
         assert action.payload.get("reason") == "interrupted"
 
+    def test_actions_are_shared_and_read_only(self, sm):
+        """Test that each state yields one cached, immutable action."""
+        action = sm.get_next_action(OnehotState.COMPLETED)
+        assert StateMachine().get_next_action(OnehotState.COMPLETED) is action
+
+        with pytest.raises(TypeError):
+            action.payload["reason"] = "changed"
+        assert sm.get_next_action(OnehotState.COMPLETED).payload["reason"] == "success"
+
+
+# Walks shared by the scenarios below: (event, expected next state, expected
+# action for that state or None)
+_TO_AUDITOR = [
+    ("start", OnehotState.WORKER_EXECUTING, None),
+    ("success", OnehotState.AUDIT_PENDING, ActionType.RUN_AUDITOR),
+    ("next", OnehotState.AUDITOR_EXECUTING, None),
+]
+
+_SCENARIOS = {
+    "successful_completion": _TO_AUDITOR + [
+        ("done", OnehotState.COMPLETED, ActionType.EXIT),
+    ],
+    "retry": _TO_AUDITOR + [
+        ("retry", OnehotState.REITERATION_PENDING, ActionType.RUN_WORKER),
+        ("next", OnehotState.WORKER_EXECUTING, None),
+        ("success", OnehotState.AUDIT_PENDING, None),
+        ("next", OnehotState.AUDITOR_EXECUTING, None),
+        ("done", OnehotState.COMPLETED, None),
+    ],
+    "zombie_success": [
+        ("start", OnehotState.WORKER_EXECUTING, None),
+        ("crash", OnehotState.RECOVERY_PENDING, ActionType.RECOVER),
+        ("zombie_success", OnehotState.AUDIT_PENDING, None),
+        ("next", OnehotState.AUDITOR_EXECUTING, None),
+        ("done", OnehotState.COMPLETED, None),
+    ],
+    "rejected": _TO_AUDITOR + [
+        ("impossible", OnehotState.REJECTED, ActionType.EXIT),
+    ],
+    "interrupt_from_created": [
+        ("interrupt", OnehotState.INTERRUPTED, ActionType.EXIT),
+    ],
+    "interrupt_from_worker": [
+        ("start", OnehotState.WORKER_EXECUTING, None),
+        ("interrupt", OnehotState.INTERRUPTED, None),
+    ],
+    "interrupt_from_auditor": _TO_AUDITOR + [
+        ("interrupt", OnehotState.INTERRUPTED, None),
+    ],
+    # Auditor timeout is fatal
+    "auditor_timeout": _TO_AUDITOR + [
+        ("inactivity", OnehotState.FAILED, None),
+    ],
+    "max_iterations": _TO_AUDITOR + [
+        ("retry", OnehotState.REITERATION_PENDING, None),
+        ("max_iterations", OnehotState.FAILED, None),
+    ],
+}
+
 
 class TestStateMachineScenarios:
     """Integration scenarios testing complete workflows."""
 
-    def test_successful_completion_scenario(self):
-        """Test complete successful workflow."""
-        sm = StateMachine()
-
-        # 1. Start from CREATED
-        assert sm.get_next_action(OnehotState.CREATED).type == ActionType.RUN_WORKER
-
-        # 2. Worker completes successfully
-        next_state = sm.transition(OnehotState.CREATED, "start")
-        assert next_state == OnehotState.WORKER_EXECUTING
-
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "success")
-        assert next_state == OnehotState.AUDIT_PENDING
-        assert sm.get_next_action(OnehotState.AUDIT_PENDING).type == ActionType.RUN_AUDITOR
-
-        # 3. Auditor runs
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        assert next_state == OnehotState.AUDITOR_EXECUTING
-
-        # 4. Auditor completes with DONE verdict
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "done")
-        assert next_state == OnehotState.COMPLETED
-        assert sm.get_next_action(OnehotState.COMPLETED).type == ActionType.EXIT
-
-    def test_retry_scenario(self):
-        """Test retry workflow."""
-        sm = StateMachine()
-
-        # First iteration
-        next_state = sm.transition(OnehotState.CREATED, "start")
-        assert next_state == OnehotState.WORKER_EXECUTING
-
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "success")
-        assert next_state == OnehotState.AUDIT_PENDING
-
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        assert next_state == OnehotState.AUDITOR_EXECUTING
-
-        # Auditor requests retry
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "retry")
-        assert next_state == OnehotState.REITERATION_PENDING
-        assert sm.get_next_action(OnehotState.REITERATION_PENDING).type == ActionType.RUN_WORKER
-
-        # Second iteration
-        next_state = sm.transition(OnehotState.REITERATION_PENDING, "next")
-        assert next_state == OnehotState.WORKER_EXECUTING
-
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "success")
-        assert next_state == OnehotState.AUDIT_PENDING
-
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        assert next_state == OnehotState.AUDITOR_EXECUTING
-
-        # Auditor completes successfully
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "done")
-        assert next_state == OnehotState.COMPLETED
-
-    def test_zombie_success_scenario(self):
-        """Test zombie success recovery scenario."""
-        sm = StateMachine()
-
-        # Worker starts
-        next_state = sm.transition(OnehotState.CREATED, "start")
-        assert next_state == OnehotState.WORKER_EXECUTING
-
-        # Worker crashes/timeout
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "crash")
-        assert next_state == OnehotState.RECOVERY_PENDING
-        assert sm.get_next_action(OnehotState.RECOVERY_PENDING).type == ActionType.RECOVER
-
-        # Recovery finds zombie success
-        next_state = sm.transition(OnehotState.RECOVERY_PENDING, "zombie_success")
-        assert next_state == OnehotState.AUDIT_PENDING
-
-        # Continue normally
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        assert next_state == OnehotState.AUDITOR_EXECUTING
-
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "done")
-        assert next_state == OnehotState.COMPLETED
-
-    def test_rejected_scenario(self):
-        """Test rejected task scenario."""
-        sm = StateMachine()
-
-        # Worker starts
-        next_state = sm.transition(OnehotState.CREATED, "start")
-        assert next_state == OnehotState.WORKER_EXECUTING
-
-        # Worker completes
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "success")
-        assert next_state == OnehotState.AUDIT_PENDING
-
-        # Auditor runs
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        assert next_state == OnehotState.AUDITOR_EXECUTING
-
-        # Auditor rejects task
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "impossible")
-        assert next_state == OnehotState.REJECTED
-        assert sm.get_next_action(OnehotState.REJECTED).type == ActionType.EXIT
-
-    def test_interrupt_scenario(self):
-        """Test interrupt scenario at various points."""
-        sm = StateMachine()
-
-        # Interrupt from CREATED
-        next_state = sm.transition(OnehotState.CREATED, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-        assert sm.get_next_action(OnehotState.INTERRUPTED).type == ActionType.EXIT
-
-        # Interrupt from WORKER_EXECUTING
-        next_state = sm.transition(OnehotState.CREATED, "start")
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-        # Interrupt from AUDITOR_EXECUTING
-        sm2 = StateMachine()
-        sm2.transition(OnehotState.CREATED, "start")
-        sm2.transition(OnehotState.WORKER_EXECUTING, "success")
-        sm2.transition(OnehotState.AUDIT_PENDING, "next")
-        next_state = sm2.transition(OnehotState.AUDITOR_EXECUTING, "interrupt")
-        assert next_state == OnehotState.INTERRUPTED
-
-    def test_auditor_timeout_is_fatal(self):
-        """Test that auditor timeout results in FAILED."""
-        sm = StateMachine()
-
-        # Setup through to AUDITOR_EXECUTING
-        sm.transition(OnehotState.CREATED, "start")
-        sm.transition(OnehotState.WORKER_EXECUTING, "success")
-        sm.transition(OnehotState.AUDIT_PENDING, "next")
-
-        # Auditor timeout -> FAILED (fatal)
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "inactivity")
-        assert next_state == OnehotState.FAILED
-
-    def test_max_iterations_check(self):
-        """Test max iterations transition."""
-        sm = StateMachine()
-
-        # Multiple iterations before hitting max
-        next_state = sm.transition(OnehotState.CREATED, "start")
-        next_state = sm.transition(OnehotState.WORKER_EXECUTING, "success")
-        next_state = sm.transition(OnehotState.AUDIT_PENDING, "next")
-        next_state = sm.transition(OnehotState.AUDITOR_EXECUTING, "retry")
-        assert next_state == OnehotState.REITERATION_PENDING
-
-        # Max iterations reached
-        next_state = sm.transition(OnehotState.REITERATION_PENDING, "max_iterations")
-        assert next_state == OnehotState.FAILED
+    @pytest.mark.parametrize("name", list(_SCENARIOS))
+    def test_scenario(self, sm, name):
+        """Walk a scenario from CREATED, checking each state and action."""
+        state = OnehotState.CREATED
+        assert sm.get_next_action(state).type == ActionType.RUN_WORKER
+
+        for event, expected_state, expected_action in _SCENARIOS[name]:
+            state = sm.transition(state, event)
+            assert state == expected_state, f"after {event!r}"
+            if expected_action is not None:
+                assert sm.get_next_action(state).type == expected_action
@@ -7,18 +7,26 @@ from oneshot.task import OneshotTask, TaskResult
 from oneshot.state_machine import TaskState
 
 
+def _stream(*lines):
+    """Return a StreamReader preloaded with lines and already at EOF."""
+    reader = asyncio.StreamReader()
+    for line in lines:
+        reader.feed_data(line)
+    reader.feed_eof()
+    return reader
+
+
 class TestOneshotTask:
     """Test OneshotTask async functionality."""
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(10)
     async def test_task_successful_execution(self):
         """Test successful task execution."""
         # Mock subprocess
         with patch('asyncio.create_subprocess_shell') as mock_proc:
             mock_process = AsyncMock()
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
+            mock_process.stdout = _stream(b'output line\n')
+            mock_process.stderr = _stream()
             mock_process.wait.return_value = 0
             poll_results = [None, None, 0]
             def poll_side_effect(*args, **kwargs):
@@ -30,16 +38,6 @@ class TestOneshotTask:
             mock_process.kill = Mock()
             mock_proc.return_value = mock_process
 
-            # Mock stream reading
-            async def mock_readline():
-                return b'output line\n'
-
-            mock_process.stdout.readline.side_effect = [
-                b'output line\n',
-                b''
-            ]
-            mock_process.stderr.readline.return_value = b''
-
             task = OneshotTask("echo test", idle_threshold=30)
             result = await task.run()
 
@@ -47,7 +45,6 @@ class TestOneshotTask:
             assert result.exit_code == 0
             assert 'output line' in result.output
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(10)
     async def test_task_failed_execution(self):
         """Test failed task execution."""
@@ -55,27 +52,10 @@ class TestOneshotTask:
             mock_process = AsyncMock()
             mock_process.wait = AsyncMock(return_value=1)
             mock_process.poll = Mock(return_value=1)
+            mock_process.stdout = _stream()
+            mock_process.stderr = _stream(b'error message\n')
             mock_proc.return_value = mock_process
 
-            # Track readline calls
-            stderr_calls = [b'error message\n', b'', b'']
-            stdout_calls = [b'', b'']
-
-            async def stderr_readline():
-                if stderr_calls:
-                    return stderr_calls.pop(0)
-                return b''
-
-            async def stdout_readline():
-                if stdout_calls:
-                    return stdout_calls.pop(0)
-                return b''
-
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr.readline = AsyncMock(side_effect=stderr_readline)
-            mock_process.stdout.readline = AsyncMock(side_effect=stdout_readline)
-
             task = OneshotTask("failing command", idle_threshold=1, activity_check_interval=0.1)
             result = await task.run()
 
@@ -83,7 +63,6 @@ class TestOneshotTask:
             assert result.exit_code == 1
             assert 'error message' in result.error
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(10)
     async def test_task_idle_detection(self):
         """Test idle detection and state transitions."""
@@ -95,13 +74,14 @@ class TestOneshotTask:
         task.state_machine.start()
         assert task.state == TaskState.RUNNING
 
-        # Simulate no activity for longer than idle threshold
-        await asyncio.sleep(0.3)
+        # Activity within the idle threshold keeps the task running
+        last_activity = task.state_machine.last_activity
+        assert task.check_idle(now=last_activity + 0.1) is False
+        assert task.state == TaskState.RUNNING
 
-        # Manually trigger idle detection (simulating what the monitor would do)
-        if task.can_interrupt:
-            task.state_machine.detect_silence()
-            assert task.state == TaskState.IDLE
+        # Simulate no activity for longer than idle threshold
+        assert task.check_idle(now=last_activity + 0.3) is True
+        assert task.state == TaskState.IDLE
 
         # Verify we can detect activity again
         task.state_machine.detect_activity()
@@ -1,25 +1,26 @@
 import pytest
-from src.oneshot.protocol import PromptGenerator, ResultSummary
+from oneshot.protocol import PromptGenerator, ResultSummary, _TRUNCATION_SUFFIX
 
-def test_generate_worker_prompt_initial():
-    generator = PromptGenerator()
-    prompt = generator.generate_worker_prompt(
+
+@pytest.fixture(scope="module")
+def generator():
+    """Shared PromptGenerator; prompt generation keeps no per-call state."""
+    return PromptGenerator()
+
+
+@pytest.fixture(scope="module")
+def initial_worker_prompt(generator):
+    return generator.generate_worker_prompt(
         oneshot_id="test-123",
         iteration=0,
         instruction="Fix the bug",
         system_prompt="You are a coder"
     )
 
-    assert "<oneshot>test-123 worker #0</oneshot>" in prompt
-    assert "You are a coder" in prompt
-    assert "<instruction>" in prompt
-    assert "Fix the bug" in prompt
-    assert "</instruction>" in prompt
-    assert "<auditor-feedback>" not in prompt
 
-def test_generate_worker_prompt_reworker():
-    generator = PromptGenerator()
-    prompt = generator.generate_worker_prompt(
+@pytest.fixture(scope="module")
+def reworker_prompt(generator):
+    return generator.generate_worker_prompt(
         oneshot_id="test-123",
         iteration=1,
         instruction="Fix the bug",
@@ -28,20 +29,9 @@ def test_generate_worker_prompt_reworker():
         reworker_system_prompt="Try harder this time"
     )
 
-    assert "<oneshot>test-123 worker #1</oneshot>" in prompt
-    assert "<auditor-feedback>" in prompt
-    assert "Please add more tests" in prompt
-    assert "</auditor-feedback>" in prompt
-    assert "<instruction>" in prompt
-    assert "Fix the bug" in prompt
-    assert "</instruction>" in prompt
-    assert "Try harder this time" in prompt
-    # Initial system prompt should be omitted or replaced in reworker flow according to requirements
-    # "the reworker flow above, like this: ... <instruction> ... $reworker_system_prompt"
-    assert "You are a coder" not in prompt 
 
-def test_generate_auditor_prompt():
-    generator = PromptGenerator()
+@pytest.fixture(scope="module")
+def auditor_prompt(generator):
     result_summary = ResultSummary(
         result="I fixed it.",
         leading_context=["Building...", "Testing..."],
@@ -49,7 +39,7 @@ def test_generate_auditor_prompt():
         score=20
     )
 
-    prompt = generator.generate_auditor_prompt(
+    return generator.generate_auditor_prompt(
         oneshot_id="test-123",
         iteration=0,
         original_prompt="Fix the bug",
@@ -57,36 +47,77 @@ def test_generate_auditor_prompt():
         auditor_system_prompt="Review this carefully"
     )
 
-    assert "<oneshot>test-123 audit #0</oneshot>" in prompt
-    assert "<what-was-requested>" in prompt
-    assert "Fix the bug" in prompt
-    assert "</what-was-requested>" in prompt
-    assert "<worker-result>" in prompt
-    assert "<leading-context>" in prompt
-    assert "Building..." in prompt
-    assert "Testing..." in prompt
-    assert "</leading-context>" in prompt
-    assert "I fixed it." in prompt
-    assert "<trailing-context>" in prompt
-    assert "Done." in prompt
-    assert "</trailing-context>" in prompt
-    assert "Review this carefully" in prompt
-
-def test_generate_auditor_prompt_no_context():
-    generator = PromptGenerator()
+
+@pytest.fixture(scope="module")
+def auditor_prompt_no_context(generator):
     result_summary = ResultSummary(result="Fixed.", score=10)
-    
-    prompt = generator.generate_auditor_prompt(
+
+    return generator.generate_auditor_prompt(
         oneshot_id="test-123",
         iteration=0,
         original_prompt="Task",
         result_summary=result_summary,
         auditor_system_prompt="Audit"
     )
-    
-    assert "<leading-context>" not in prompt
-    assert "<trailing-context>" not in prompt
-    assert "Fixed." in prompt
+
+
+@pytest.mark.parametrize("needle, present", [
+    ("<oneshot>test-123 worker #0</oneshot>", True),
+    ("You are a coder", True),
+    ("<instruction>", True),
+    ("Fix the bug", True),
+    ("</instruction>", True),
+    ("<auditor-feedback>", False),
+])
+def test_generate_worker_prompt_initial(initial_worker_prompt, needle, present):
+    assert (needle in initial_worker_prompt) is present
+
+
+@pytest.mark.parametrize("needle, present", [
+    ("<oneshot>test-123 worker #1</oneshot>", True),
+    ("<auditor-feedback>", True),
+    ("Please add more tests", True),
+    ("</auditor-feedback>", True),
+    ("<instruction>", True),
+    ("Fix the bug", True),
+    ("</instruction>", True),
+    ("Try harder this time", True),
+    # Initial system prompt should be omitted or replaced in reworker flow according to requirements
+    # "the reworker flow above, like this: ... <instruction> ... $reworker_system_prompt"
+    ("You are a coder", False),
+])
+def test_generate_worker_prompt_reworker(reworker_prompt, needle, present):
+    assert (needle in reworker_prompt) is present
+
+
+@pytest.mark.parametrize("needle", [
+    "<oneshot>test-123 audit #0</oneshot>",
+    "<what-was-requested>",
+    "Fix the bug",
+    "</what-was-requested>",
+    "<worker-result>",
+    "<leading-context>",
+    "Building...",
+    "Testing...",
+    "</leading-context>",
+    "I fixed it.",
+    "<trailing-context>",
+    "Done.",
+    "</trailing-context>",
+    "Review this carefully",
+])
+def test_generate_auditor_prompt(auditor_prompt, needle):
+    assert needle in auditor_prompt
+
+
+@pytest.mark.parametrize("needle, present", [
+    ("<leading-context>", False),
+    ("<trailing-context>", False),
+    ("Fixed.", True),
+])
+def test_generate_auditor_prompt_no_context(auditor_prompt_no_context, needle, present):
+    assert (needle in auditor_prompt_no_context) is present
+
 
 def test_prompt_truncation():
     generator = PromptGenerator(max_prompt_length=50)
@@ -96,6 +127,18 @@ def test_prompt_truncation():
         instruction="Very long instruction that exceeds fifty characters definitely",
         system_prompt="Sys"
     )
-    
-    assert len(prompt) <= 50 + len("... [TRUNCATED]")
-    assert "[TRUNCATED]" in prompt
+
+    assert len(prompt) <= 50 + len(_TRUNCATION_SUFFIX)
+    assert prompt.endswith(_TRUNCATION_SUFFIX)
+
+
+def test_prompt_truncation_huge_input(generator):
+    kwargs = dict(
+        oneshot_id="test-123",
+        iteration=0,
+        instruction="x" * 1_000_000,
+        system_prompt="Sys"
+    )
+    prompt = PromptGenerator(max_prompt_length=50).generate_worker_prompt(**kwargs)
+
+    assert prompt == generator.generate_worker_prompt(**kwargs)[:50] + _TRUNCATION_SUFFIX